@@ -5,6 +5,7 @@ It initializes the Qt application and displays the main window.
 """
 
 import sys
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 
 from src.business_card_generator.ui.main_window import MainWindow
@@ -15,6 +16,9 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Business Card Generator")
     
+    # Room for decoded and scaled field images in the card preview (KB)
+    QPixmapCache.setCacheLimit(64 * 1024)
+    
     window = MainWindow()
     window.show()
     
@@ -1,6 +1,36 @@
 """Core business logic for the business card generator."""
 
-from .card_data_model import CardDataModel
-from .export_engine import ExportEngine
+import importlib
 
-__all__ = ["CardDataModel", "ExportEngine"]
+# Names are imported on first access, so importing the data model doesn't
+# pull in the export engine (reportlab, PIL) or openpyxl at startup
+_LAZY_ATTRS = {
+    "CardDataModel": "card_data_model",
+    "ExcelImportWorker": "excel_import",
+    "ExcelSheet": "excel_import",
+    "ExportEngine": "export_engine",
+    "ImageCopyWorker": "image_copy",
+    "read_excel": "excel_import",
+}
+
+__all__ = [
+    "CardDataModel",
+    "ExcelImportWorker",
+    "ExcelSheet",
+    "ExportEngine",
+    "ImageCopyWorker",
+    "read_excel",
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -4,20 +4,33 @@ This module provides a QAbstractTableModel where columns are defined
 by the CardTemplate's fields, and rows are CardRow instances.
 """
 
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional
 import uuid
 
 from PySide6.QtCore import (
     QAbstractTableModel,
+    QByteArray,
     QModelIndex,
     QObject,
     Qt,
     Signal,
 )
 
+from .constants import CARD_WIDTH, CARD_HEIGHT
 from ..models.card import CardTemplate, CardRow, FieldDefinition, FieldType
 
 
+# Roles data() answers; views ask for many more per cell on every paint
+DATA_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole))
+# Roles headerData() answers
+HEADER_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole))
+# Role names exposed to views, built once
+ROLE_NAMES = {
+    Qt.ItemDataRole.DisplayRole: QByteArray(b"display"),
+    Qt.ItemDataRole.EditRole: QByteArray(b"edit"),
+}
+
 class CardDataModel(QAbstractTableModel):
     """Qt model for template-based card data.
     
@@ -39,6 +52,34 @@ class CardDataModel(QAbstractTableModel):
         super().__init__(parent)
         self._template = CardTemplate()
         self._rows: list[CardRow] = []
+        # Row ID -> position in _rows; verified on every lookup and rebuilt
+        # when stale, so direct edits of _rows can't return a wrong row
+        self._row_index: dict[str, int] = {}
+        
+        # Bumped on every template change so renders can be cached safely
+        self._template_version = 0
+        self.template_changed.connect(self._bump_template_version)
+        
+        # Fields sorted by z_index and each field's position in that order.
+        # Dropped when fields are added or removed, a z_index changes or the
+        # model is reset, but not on moves and resizes, so drags keep it.
+        # Comparing against the list that was sorted also catches
+        # CardTemplate.set_fields().
+        self._sorted_z_cache: Optional[list[FieldDefinition]] = None
+        self._sorted_z_index: dict[str, int] = {}
+        self._sorted_z_source: Optional[list[FieldDefinition]] = None
+        self.modelReset.connect(self._invalidate_z_cache)
+        
+        # Field names in use (built lazily) and the next suffix to try per
+        # base name, maintained incrementally by the field mutators
+        self._name_set: Optional[set[str]] = None
+        self._name_next: dict[str, int] = {}
+        self.modelReset.connect(self._invalidate_name_cache)
+        
+        # Nesting depth of block_template_signals() and whether a
+        # template_changed is owed once the outermost block exits
+        self._signal_block_depth = 0
+        self._pending_template_changed = False
         
         # Add default fields
         self._add_default_fields()
@@ -59,7 +100,7 @@ class CardDataModel(QAbstractTableModel):
                 x=x, y=y, width=w, height=h,
                 font_size=12 if ftype == FieldType.TEXT else 12
             )
-            self._template.fields.append(field_def)
+            self._template.add_field(field_def)
     
     # Qt Model Interface
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
@@ -73,7 +114,8 @@ class CardDataModel(QAbstractTableModel):
         return len(self._template.fields)
     
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
-        if not index.isValid():
+        # Check the role first: most calls are for roles this model ignores
+        if role not in DATA_ROLES or not index.isValid():
             return None
         
         row_idx = index.row()
@@ -86,11 +128,7 @@ class CardDataModel(QAbstractTableModel):
         
         row = self._rows[row_idx]
         field_def = self._template.fields[col_idx]
-        
-        if role in (Qt.DisplayRole, Qt.EditRole):
-            return row.get_value(field_def.id)
-        
-        return None
+        return row.data.get(field_def.id, "")
     
     def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
         if not index.isValid() or role != Qt.EditRole:
@@ -113,6 +151,8 @@ class CardDataModel(QAbstractTableModel):
     
     def headerData(self, section: int, orientation: Qt.Orientation, 
                    role: int = Qt.DisplayRole) -> Any:
+        if role not in HEADER_ROLES:
+            return None
         if orientation == Qt.Horizontal:
             if 0 <= section < len(self._template.fields):
                 field_def = self._template.fields[section]
@@ -126,6 +166,9 @@ class CardDataModel(QAbstractTableModel):
                 return str(section + 1)
         return None
     
+    def roleNames(self) -> dict[int, QByteArray]:
+        return ROLE_NAMES
+    
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         if not index.isValid():
             return Qt.NoItemFlags
@@ -136,13 +179,110 @@ class CardDataModel(QAbstractTableModel):
         """Return the current template."""
         return self._template
     
+    def get_template_version(self) -> int:
+        """Return a counter that increases whenever the template changes."""
+        return self._template_version
+    
+    def _bump_template_version(self) -> None:
+        self._template_version += 1
+    
+    def _names(self) -> set[str]:
+        """Return the set of field names, building it if needed."""
+        if self._name_set is None:
+            self._name_set = {f.name for f in self._template.fields}
+            self._name_next.clear()
+        return self._name_set
+    
+    def _invalidate_name_cache(self) -> None:
+        self._name_set = None
+        self._name_next.clear()
+    
+    def _add_name(self, name: str) -> None:
+        if self._name_set is not None:
+            self._name_set.add(name)
+    
+    def _discard_name(self, name: str) -> None:
+        if self._name_set is None:
+            return
+        if any(f.name == name for f in self._template.fields):
+            # Another field still uses this name
+            return
+        self._name_set.discard(name)
+        # A freed suffix should be reused, so restart probing for its base
+        base, _, suffix = name.rpartition("_")
+        if suffix.isdigit():
+            self._name_next.pop(base, None)
+    
+    def _emit_template_changed(self) -> None:
+        """Emit template_changed, or defer it while signals are blocked."""
+        if self._signal_block_depth:
+            self._pending_template_changed = True
+        else:
+            self.template_changed.emit()
+    
+    @contextmanager
+    def block_template_signals(self) -> Iterator[None]:
+        """Coalesce template_changed signals for a batch of edits.
+        
+        Mutations inside the block emit nothing; a single template_changed
+        is emitted when the outermost block exits, if anything changed.
+        """
+        self._signal_block_depth += 1
+        try:
+            yield
+        finally:
+            self._signal_block_depth -= 1
+            if not self._signal_block_depth and self._pending_template_changed:
+                self._pending_template_changed = False
+                self.template_changed.emit()
+    
+    def notify_field_changed(self, field_id: str) -> None:
+        """Notify the model that a field definition was edited in place.
+        
+        Refreshes derived lookups, the template version and the column
+        header for the field.
+        """
+        # The field may have been renamed
+        self._template.reindex()
+        self._invalidate_name_cache()
+        # No template_changed here, but cached renders are still stale
+        self._bump_template_version()
+        # The edit may have touched z_index
+        self._invalidate_z_cache()
+        for col, field_def in enumerate(self._template.fields):
+            if field_def.id == field_id:
+                self.headerDataChanged.emit(Qt.Horizontal, col, col)
+                break
+    
+    def reset_with(self, template: Optional[CardTemplate] = None,
+                   rows: Iterable[CardRow] = ()) -> None:
+        """Replace the template and rows in place, resetting the model.
+        
+        Keeping the same model object keeps every existing signal connection
+        valid, so views don't have to be rewired when a project is loaded.
+        
+        Args:
+            template: The new template, or None for the default fields.
+            rows: The new rows.
+        """
+        self.beginResetModel()
+        if template is None:
+            self._template = CardTemplate()
+            self._add_default_fields()
+        else:
+            self._template = template
+        self._rows = list(rows)
+        self._row_index = {}
+        self.endResetModel()
+        self._emit_template_changed()
+    
     def set_template(self, template: CardTemplate) -> None:
         """Set a new template, resetting the model."""
         self.beginResetModel()
         self._template = template
         self._rows.clear()
         self.endResetModel()
-        self.template_changed.emit()
+        self._emit_template_changed()
     
     def add_field(self, name: str, field_type: FieldType = FieldType.TEXT) -> str:
         """Add a new field/column to the template.
@@ -156,7 +296,6 @@ class CardDataModel(QAbstractTableModel):
         height = 25 if field_type == FieldType.TEXT else 80
         
         # Center the field in the card preview
-        from src.business_card_generator.ui.card_designer import CARD_WIDTH, CARD_HEIGHT
         x = (CARD_WIDTH - width) // 2
         y = (CARD_HEIGHT - height) // 2
         
@@ -172,11 +311,13 @@ class CardDataModel(QAbstractTableModel):
         )
         
         self.beginInsertColumns(QModelIndex(), col, col)
-        self._template.fields.append(field_def)
+        self._template.add_field(field_def)
         self.endInsertColumns()
+        self._add_name(field_def.name)
+        self._invalidate_z_cache()
         
         self.field_added.emit(field_def.id)
-        self.template_changed.emit()
+        self._emit_template_changed()
         return field_def.id
     
     def remove_field(self, field_id: str) -> bool:
@@ -184,14 +325,16 @@ class CardDataModel(QAbstractTableModel):
         for idx, field_def in enumerate(self._template.fields):
             if field_def.id == field_id:
                 self.beginRemoveColumns(QModelIndex(), idx, idx)
-                self._template.fields.pop(idx)
+                self._template.remove_field(field_id)
                 # Remove data from all rows
                 for row in self._rows:
                     row.data.pop(field_id, None)
                 self.endRemoveColumns()
+                self._discard_name(field_def.name)
+                self._invalidate_z_cache()
                 
                 self.field_removed.emit(field_id)
-                self.template_changed.emit()
+                self._emit_template_changed()
                 return True
         return False
     
@@ -211,7 +354,7 @@ class CardDataModel(QAbstractTableModel):
         if field_def:
             field_def.x = x
             field_def.y = y
-            self.template_changed.emit()
+            self._emit_template_changed()
     
     def update_field_size(self, field_id: str, width: int, height: int) -> None:
         """Update a field's size on the card preview."""
@@ -219,9 +362,18 @@ class CardDataModel(QAbstractTableModel):
         if field_def:
             field_def.width = width
             field_def.height = height
-            self.template_changed.emit()
+            self._emit_template_changed()
     
     # Row Management
+    def index_of_row_id(self, row_id: str) -> Optional[int]:
+        """Return the position of a row by ID, or None if it doesn't exist."""
+        rows = self._rows
+        idx = self._row_index.get(row_id)
+        if idx is None or idx >= len(rows) or rows[idx].id != row_id:
+            self._row_index = {row.id: i for i, row in enumerate(rows)}
+            idx = self._row_index.get(row_id)
+        return idx
+    
     def add_row(self) -> str:
         """Add a new empty row. Returns the row ID."""
         row = CardRow()
@@ -229,26 +381,33 @@ class CardDataModel(QAbstractTableModel):
         
         self.beginInsertRows(QModelIndex(), row_idx, row_idx)
         self._rows.append(row)
+        self._row_index[row.id] = row_idx
         self.endInsertRows()
         
         return row.id
     
     def remove_row(self, row_id: str) -> bool:
         """Remove a row by ID."""
-        for idx, row in enumerate(self._rows):
-            if row.id == row_id:
-                self.beginRemoveRows(QModelIndex(), idx, idx)
-                self._rows.pop(idx)
-                self.endRemoveRows()
-                return True
-        return False
+        idx = self.index_of_row_id(row_id)
+        if idx is None:
+            return False
+        
+        self.beginRemoveRows(QModelIndex(), idx, idx)
+        self._rows.pop(idx)
+        self._row_index.pop(row_id, None)
+        # Reassign from positions rather than shifting, so entries that were
+        # missing or stale before the removal come out right too
+        for i, row in enumerate(self._rows[idx:], idx):
+            self._row_index[row.id] = i
+        self.endRemoveRows()
+        return True
     
     def get_row(self, row_id: str) -> Optional[CardRow]:
         """Get a row by ID."""
-        for row in self._rows:
-            if row.id == row_id:
-                return row
-        return None
+        idx = self.index_of_row_id(row_id)
+        if idx is None:
+            return None
+        return self._rows[idx]
     
     def get_row_at_index(self, idx: int) -> Optional[CardRow]:
         """Get a row by index."""
@@ -271,34 +430,52 @@ class CardDataModel(QAbstractTableModel):
         return list(self._template.fields)
     
     def get_fields_sorted_by_z_index(self) -> list[FieldDefinition]:
-        """Return all field definitions sorted by z_index (lowest first)."""
-        return sorted(self._template.fields, key=lambda f: f.z_index)
+        """Return all field definitions sorted by z_index (lowest first).
+        
+        The list is cached until fields are added or removed or their z-order
+        changes, and must not be modified by callers.
+        """
+        fields = self._template.fields
+        if self._sorted_z_cache is None or fields is not self._sorted_z_source:
+            self._sorted_z_cache = sorted(fields, key=lambda f: f.z_index)
+            self._sorted_z_index = {f.id: i for i, f in enumerate(self._sorted_z_cache)}
+            self._sorted_z_source = fields
+        return self._sorted_z_cache
+    
+    def _invalidate_z_cache(self) -> None:
+        """Drop the cached z-order after fields or their z_index change."""
+        self._sorted_z_cache = None
+        self._sorted_z_index = {}
     
     def get_max_z_index(self) -> int:
         """Get the maximum z_index among all fields."""
-        if not self._template.fields:
+        sorted_fields = self.get_fields_sorted_by_z_index()
+        if not sorted_fields:
             return 0
-        return max(f.z_index for f in self._template.fields)
+        return sorted_fields[-1].z_index
     
     def get_min_z_index(self) -> int:
         """Get the minimum z_index among all fields."""
-        if not self._template.fields:
+        sorted_fields = self.get_fields_sorted_by_z_index()
+        if not sorted_fields:
             return 0
-        return min(f.z_index for f in self._template.fields)
+        return sorted_fields[0].z_index
     
     def bring_to_front(self, field_id: str) -> None:
         """Move field to the front (highest z_index)."""
         field = self.get_field_by_id(field_id)
         if field:
             field.z_index = self.get_max_z_index() + 1
-            self.template_changed.emit()
+            self._invalidate_z_cache()
+            self._emit_template_changed()
     
     def send_to_back(self, field_id: str) -> None:
         """Move field to the back (lowest z_index)."""
         field = self.get_field_by_id(field_id)
         if field:
             field.z_index = self.get_min_z_index() - 1
-            self.template_changed.emit()
+            self._invalidate_z_cache()
+            self._emit_template_changed()
     
     def bring_forward(self, field_id: str) -> None:
         """Move field one step forward in z-order."""
@@ -308,7 +485,7 @@ class CardDataModel(QAbstractTableModel):
         
         # Find the next field above this one
         sorted_fields = self.get_fields_sorted_by_z_index()
-        current_idx = next((i for i, f in enumerate(sorted_fields) if f.id == field_id), -1)
+        current_idx = self._sorted_z_index.get(field_id, -1)
         
         if current_idx >= 0 and current_idx < len(sorted_fields) - 1:
             # Swap z_index with the next field
@@ -317,7 +494,8 @@ class CardDataModel(QAbstractTableModel):
             # Ensure they're different if they were the same
             if field.z_index == next_field.z_index:
                 field.z_index += 1
-            self.template_changed.emit()
+            self._invalidate_z_cache()
+            self._emit_template_changed()
     
     def send_backward(self, field_id: str) -> None:
         """Move field one step backward in z-order."""
@@ -327,7 +505,7 @@ class CardDataModel(QAbstractTableModel):
         
         # Find the previous field below this one
         sorted_fields = self.get_fields_sorted_by_z_index()
-        current_idx = next((i for i, f in enumerate(sorted_fields) if f.id == field_id), -1)
+        current_idx = self._sorted_z_index.get(field_id, -1)
         
         if current_idx > 0:
             # Swap z_index with the previous field
@@ -336,7 +514,8 @@ class CardDataModel(QAbstractTableModel):
             # Ensure they're different if they were the same
             if field.z_index == prev_field.z_index:
                 field.z_index -= 1
-            self.template_changed.emit()
+            self._invalidate_z_cache()
+            self._emit_template_changed()
     
     def add_field_definition(self, field_def: FieldDefinition) -> str:
         """Add an existing field definition to the template.
@@ -346,23 +525,27 @@ class CardDataModel(QAbstractTableModel):
         col = len(self._template.fields)
         
         self.beginInsertColumns(QModelIndex(), col, col)
-        self._template.fields.append(field_def)
+        self._template.add_field(field_def)
         self.endInsertColumns()
+        self._add_name(field_def.name)
+        self._invalidate_z_cache()
         
         self.field_added.emit(field_def.id)
-        self.template_changed.emit()
+        self._emit_template_changed()
         return field_def.id
     
     def get_unique_field_name(self, base_name: str) -> str:
         """Generate a unique field name by adding _1, _2, etc. suffix."""
-        existing_names = {f.name for f in self._template.fields}
+        existing_names = self._names()
         
         if base_name not in existing_names:
             return base_name
         
-        counter = 1
+        # Suffixes below the remembered one are known to be taken
+        counter = self._name_next.get(base_name, 1)
         while f"{base_name}_{counter}" in existing_names:
             counter += 1
+        self._name_next[base_name] = counter
         
         return f"{base_name}_{counter}"
     
@@ -370,7 +553,11 @@ class CardDataModel(QAbstractTableModel):
         """Update a field's name."""
         field = self.get_field_by_id(field_id)
         if field:
+            old_name = field.name
             field.name = new_name
-            self.template_changed.emit()
+            self._template.reindex()
+            self._discard_name(old_name)
+            self._add_name(new_name)
+            self._emit_template_changed()
             return True
         return False
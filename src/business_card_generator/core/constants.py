@@ -0,0 +1,6 @@
+"""Shared card dimensions used by the model, designer and export engine."""
+
+# Standard business card dimensions (in pixels at 96 DPI for preview)
+# Standard card is 3.5" x 2" = 336 x 192 pixels
+CARD_WIDTH = 336
+CARD_HEIGHT = 192
@@ -0,0 +1,120 @@
+"""Excel import for business card data.
+
+This module reads an Excel sheet into plain headers and row values, detecting
+which columns hold image filenames. Reading runs on a worker thread through
+ExcelImportWorker so large sheets don't block the UI.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+# Image file extensions for auto-detection
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')
+
+# Header words that suggest an image column
+IMAGE_HEADER_KEYWORDS = ('photo', 'image', 'logo', 'picture', 'pic')
+
+# Data rows inspected when detecting image columns
+DETECT_ROWS = 8
+
+
+@dataclass
+class ExcelSheet:
+    """Contents of an imported sheet."""
+    headers: list[str]
+    rows: list[list[Any]] = field(default_factory=list)
+    image_columns: set[int] = field(default_factory=set)
+
+
+def read_excel(file_path: str) -> ExcelSheet:
+    """Read the active sheet of an Excel file.
+    
+    The first row holds the headers; each later row becomes a list of raw
+    cell values, one per header.
+    
+    Args:
+        file_path: Path to the workbook.
+    """
+    from openpyxl import load_workbook
+    
+    # Read-only mode streams rows as plain value tuples instead of
+    # building a Cell object for every access
+    wb = load_workbook(file_path, data_only=True, read_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        
+        # Get headers from first row
+        headers = [
+            str(value).strip() if value else f"Column{col}"
+            for col, value in enumerate(next(rows, ()), start=1)
+        ]
+        sheet = ExcelSheet(headers=headers)
+        if not headers:
+            return sheet
+        
+        num_cols = len(headers)
+        padding = [None] * num_cols
+        
+        # Columns whose header names an image need only a non-empty cell;
+        # the rest need a value that looks like an image filename. Cells
+        # are only checked for undecided columns in the first few rows.
+        header_image = {
+            col for col, header in enumerate(headers)
+            if any(kw in header.lower() for kw in IMAGE_HEADER_KEYWORDS)
+        }
+        undecided = set(range(num_cols))
+        
+        for row_num, values in enumerate(rows):
+            # Rows can be shorter than the header row
+            row = list(values[:num_cols])
+            if len(row) < num_cols:
+                row.extend(padding[len(row):])
+            sheet.rows.append(row)
+            
+            if undecided and row_num < DETECT_ROWS:
+                for col in list(undecided):
+                    cell_value = row[col]
+                    if cell_value and (col in header_image
+                                       or str(cell_value).lower().endswith(IMAGE_EXTENSIONS)):
+                        sheet.image_columns.add(col)
+                        undecided.discard(col)
+    finally:
+        wb.close()
+    
+    return sheet
+
+
+class ExcelImportSignals(QObject):
+    """Signals for ExcelImportWorker.
+    
+    Signals:
+        finished: Emitted with the ExcelSheet once reading succeeds.
+        error: Emitted with a message if reading fails.
+    """
+    
+    finished = Signal(object)  # ExcelSheet
+    error = Signal(str)
+
+
+class ExcelImportWorker(QRunnable):
+    """Reads an Excel file on a thread pool thread.
+    
+    The signals object is created on the calling thread, so its signals are
+    delivered there through queued connections.
+    """
+    
+    def __init__(self, file_path: str):
+        super().__init__()
+        self._file_path = file_path
+        self.signals = ExcelImportSignals()
+    
+    def run(self) -> None:
+        try:
+            sheet = read_excel(self._file_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(sheet)
@@ -2,35 +2,41 @@
 
 This module provides the ExportEngine class that handles exporting business
 cards to PDF and Word document formats, preserving card styling and layout.
+ExportWorker runs an export on a thread pool thread with progress reports.
 """
 
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtCore import QLineF, QObject, QRect, QRunnable, QSize, Qt, Signal
 from PySide6.QtGui import (
     QColor,
     QFont,
     QImage,
     QPainter,
     QPen,
-    QPixmap,
 )
 
+from PIL import Image
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas as pdf_canvas
 from reportlab.lib.utils import ImageReader
-from reportlab.lib.colors import gray
+from reportlab.lib.colors import Color, HexColor, black, gray
+from reportlab import rl_config
+from reportlab.pdfbase.pdfmetrics import getAscentDescent, getFont, registerFont
+from reportlab.pdfbase.ttfonts import TTFError, TTFont
 
 from .card_data_model import CardDataModel
+from .constants import CARD_WIDTH, CARD_HEIGHT
 from ..models.card import CardRow, FieldDefinition, FieldType
 
 
-# Standard business card dimensions (in pixels at 96 DPI for preview)
-CARD_WIDTH = 336
-CARD_HEIGHT = 192
-
 # Standard credit card size in inches (3.5" x 2")
 CARD_WIDTH_INCHES = 3.5
 CARD_HEIGHT_INCHES = 2.0
@@ -38,6 +44,131 @@ CARD_HEIGHT_INCHES = 2.0
 # Points per inch for PDF
 POINTS_PER_INCH = 72
 
+# Render scale relative to preview pixels. 2x gives ~192 DPI on a 3.5" card,
+# which is already above print requirements for body text; text-only cards
+# render crisply at 1.5x. Pass a higher render_scale for maximum quality.
+DEFAULT_RENDER_SCALE = 2
+TEXT_ONLY_RENDER_SCALE = 1.5
+
+# PDF points per preview pixel (a 336px wide preview maps to 252pt)
+PREVIEW_TO_POINTS = CARD_WIDTH_INCHES * POINTS_PER_INCH / CARD_WIDTH
+
+# Built-in PDF font families used for vector text, keyed by template font
+PDF_FONT_FAMILIES = {
+    "Helvetica": "Helvetica",
+    "Times New Roman": "Times",
+    "Courier New": "Courier",
+}
+
+# Windows TrueType file names of the other template fonts, as (regular,
+# bold, italic, bold italic). Other systems name the files after the
+# family, e.g. "Arial Bold.ttf" or "Arial_Bold.ttf".
+PDF_TTF_FILES = {
+    "Arial": ("arial", "arialbd", "ariali", "arialbi"),
+    "Georgia": ("georgia", "georgiab", "georgiai", "georgiaz"),
+    "Verdana": ("verdana", "verdanab", "verdanai", "verdanaz"),
+    "Trebuchet MS": ("trebuc", "trebucbd", "trebucit", "trebucbi"),
+}
+PDF_TTF_STYLES = ("", "bold", "italic", "bolditalic")
+
+# Built-in PDF font names keyed by (family, bold, italic)
+PDF_FONT_NAMES = {
+    ("Helvetica", False, False): "Helvetica",
+    ("Helvetica", True, False): "Helvetica-Bold",
+    ("Helvetica", False, True): "Helvetica-Oblique",
+    ("Helvetica", True, True): "Helvetica-BoldOblique",
+    ("Times", False, False): "Times-Roman",
+    ("Times", True, False): "Times-Bold",
+    ("Times", False, True): "Times-Italic",
+    ("Times", True, True): "Times-BoldItalic",
+    ("Courier", False, False): "Courier",
+    ("Courier", True, False): "Courier-Bold",
+    ("Courier", False, True): "Courier-Oblique",
+    ("Courier", True, True): "Courier-BoldOblique",
+}
+
+# Grid (columns, rows) for each supported cards-per-page setting
+CARD_LAYOUTS = {
+    1: (1, 1), 2: (1, 2), 4: (2, 2),
+    6: (2, 3), 8: (2, 4), 10: (2, 5)
+}
+
+# Cut line extension beyond card edges, in points
+CUT_LINE_EXTEND = 10
+
+# PIL raw mode matching QImage.Format_RGB32 (0xffRRGGBB words) in memory
+RGB32_RAW_MODE = "BGRX" if sys.byteorder == "little" else "XRGB"
+
+# Fixed colors for card borders and empty image placeholders
+BORDER_COLOR = QColor("#cccccc")
+PLACEHOLDER_COLOR = QColor("#999999")
+BORDER_PEN = QPen(BORDER_COLOR)
+BORDER_PEN.setWidth(1)
+PDF_BORDER_COLOR = HexColor("#cccccc")
+PDF_PLACEHOLDER_COLOR = HexColor("#999999")
+
+# Called with (cards done, total cards) as an export progresses
+ProgressCallback = Callable[[int, int], None]
+
+
+class ExportCancelled(Exception):
+    """Raised by a progress callback to stop an export early."""
+
+
+@lru_cache(maxsize=128)
+def _qcolor(hex_str: str) -> QColor:
+    """Return a shared QColor for a hex string. Callers must not modify it."""
+    return QColor(hex_str)
+
+
+def _font_file_key(name: str) -> str:
+    """Normalize a font file stem, so "Arial_Bold" and "Arial Bold" match."""
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+@lru_cache(maxsize=1)
+def _system_font_files() -> dict[str, str]:
+    """Map the normalized stem of each installed TrueType file to its path."""
+    folders = list(rl_config.TTFSearchPath)
+    if os.environ.get("WINDIR"):
+        folders.append(os.path.join(os.environ["WINDIR"], "Fonts"))
+    if os.environ.get("LOCALAPPDATA"):
+        # Fonts installed for the current user only
+        folders.append(os.path.join(os.environ["LOCALAPPDATA"], "Microsoft", "Windows", "Fonts"))
+    files: dict[str, str] = {}
+    for folder in folders:
+        for root, _dirs, names in os.walk(os.path.expanduser(folder)):
+            for name in names:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() == ".ttf":
+                    files.setdefault(_font_file_key(stem), os.path.join(root, name))
+    return files
+
+
+@lru_cache(maxsize=64)
+def _pdf_ttf_font(family: str, bold: bool, italic: bool) -> Optional[str]:
+    """Register an installed TrueType font for PDF text and return its name.
+    
+    Returns None for families without a known file, or whose file isn't
+    installed; their text is rasterized with the font Qt picks instead.
+    """
+    windows_names = PDF_TTF_FILES.get(family)
+    if windows_names is None:
+        return None
+    style = bold + 2 * italic
+    files = _system_font_files()
+    for stem in (windows_names[style], _font_file_key(family) + PDF_TTF_STYLES[style]):
+        path = files.get(stem)
+        if path is None:
+            continue
+        font_name = f"{family}-{PDF_TTF_STYLES[style] or 'regular'}"
+        try:
+            registerFont(TTFont(font_name, path))
+        except TTFError:
+            continue
+        return font_name
+    return None
+
 
 class ExportEngine:
     """Generates PDF and DOCX exports of business cards.
@@ -46,15 +177,40 @@ class ExportEngine:
     supporting multiple cards per page with configurable layouts.
     """
     
-    def __init__(self, model: CardDataModel, project_path: Optional[str] = None):
+    def __init__(
+        self, model: CardDataModel, project_path: Optional[str] = None,
+        draw_placeholders: bool = False
+    ):
         """Initialize with card data model.
         
         Args:
             model: The CardDataModel containing template and rows.
             project_path: Optional path to project folder for resolving images.
+            draw_placeholders: Outline image fields that have no usable
+                image. Off by default since the outline is a design aid,
+                not print output.
         """
         self._model = model
         self._project_path = project_path
+        self._draw_placeholders = draw_placeholders
+        # JPEG-encoded card renders for DOCX embedding, keyed by
+        # _card_cache_key(). Only the compressed bytes are kept, so memory
+        # stays small however many distinct rows are exported.
+        self._jpeg_cache: dict[tuple, bytes] = {}
+        # Whether reportlab could read each image path embedded in a PDF
+        self._pdf_images: dict[str, bool] = {}
+        # Decoded images keyed by (absolute path, mtime), and their scaled
+        # versions keyed by (absolute path, mtime, width, height)
+        self._image_cache: dict[tuple[str, int], QImage] = {}
+        self._scaled_cache: dict[tuple[str, int, int, int], QImage] = {}
+        # Scaled per-field pixel rects keyed by (template, version, size)
+        self._rect_cache: dict[tuple, list[tuple[int, int, int, int]]] = {}
+        # DOCX cards render on several threads, which all share the caches
+        # above, so every read and write of them holds this lock
+        self._cache_lock = threading.Lock()
+        # Per-field (font, color) pairs, keyed like the rects. QFont is not
+        # thread-safe, so each thread builds and keeps its own.
+        self._thread_styles = threading.local()
     
     def calculate_layout(self, page_size: QSize, cards_per_page: int) -> list[QRect]:
         """Calculate card positions for given page layout.
@@ -62,7 +218,7 @@ class ExportEngine:
         Cards are always rendered at standard credit card size (3.5" x 2").
         Returns positions in points (72 points per inch).
         """
-        if cards_per_page not in (1, 2, 4, 6, 8, 10):
+        if cards_per_page not in CARD_LAYOUTS:
             raise ValueError(f"Unsupported cards_per_page: {cards_per_page}")
         
         page_width = page_size.width()
@@ -72,12 +228,7 @@ class ExportEngine:
         card_width = int(CARD_WIDTH_INCHES * POINTS_PER_INCH)
         card_height = int(CARD_HEIGHT_INCHES * POINTS_PER_INCH)
         
-        layouts = {
-            1: (1, 1), 2: (1, 2), 4: (2, 2), 
-            6: (2, 3), 8: (2, 4), 10: (2, 5)
-        }
-        
-        cols, rows = layouts[cards_per_page]
+        cols, rows = CARD_LAYOUTS[cards_per_page]
         
         # Check if cards fit on page
         margin = 36  # 0.5 inch margin
@@ -107,46 +258,59 @@ class ExportEngine:
         
         return positions
     
-    def render_card(self, row: CardRow, width: int, height: int) -> QImage:
-        """Render a single card row to image for export."""
+    def render_card(
+        self, row: CardRow, width: int, height: int,
+        styles: Optional[list[tuple[QFont, QColor]]] = None
+    ) -> QImage:
+        """Render a single card row to image for export.
+        
+        Args:
+            row: The row whose values fill the template fields.
+            width: Output width in pixels.
+            height: Output height in pixels.
+            styles: Per-field (font, color) pairs from _get_field_styles();
+                looked up for the given size when omitted.
+        """
         template = self._model.get_template()
+        if styles is None:
+            styles = self._get_field_styles(width, height)
         
-        image = QImage(width, height, QImage.Format.Format_ARGB32)
-        bg_color = QColor(template.background_color)
-        image.fill(bg_color)
+        # Cards are always opaque, so skip the alpha channel and its blending
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(_qcolor(template.background_color))
         
         painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         
-        scale_x = width / CARD_WIDTH
-        scale_y = height / CARD_HEIGHT
-        
         # Draw border
-        border_pen = QPen(QColor("#cccccc"))
-        border_pen.setWidth(1)
-        painter.setPen(border_pen)
+        painter.setPen(BORDER_PEN)
         painter.drawRect(0, 0, width - 1, height - 1)
         
+        # Look up every field value up front rather than per-field calls
+        data_get = row.data.get
+        fields = template.fields
+        values = [data_get(f.id, "") for f in fields]
+        rects = self._get_field_rects(width, height)
+        text_type = FieldType.TEXT
+        draw_placeholders = self._draw_placeholders
+        
         # Render each field
-        for field in template.fields:
-            value = row.get_value(field.id)
-            
-            elem_x = int(field.x * scale_x)
-            elem_y = int(field.y * scale_y)
-            elem_width = int(field.width * scale_x)
-            elem_height = int(field.height * scale_y)
+        for field, value, (font, color), (elem_x, elem_y, elem_width, elem_height) in zip(
+            fields, values, styles, rects
+        ):
+            if not value and not (draw_placeholders and field.field_type != text_type):
+                # Nothing to draw for empty text or image fields
+                continue
             
-            if field.field_type == FieldType.TEXT:
+            if field.field_type == text_type:
                 self._render_text(
-                    painter, str(value) if value else "",
-                    elem_x, elem_y, elem_width, elem_height, field, scale_x, scale_y
+                    painter, str(value),
+                    elem_x, elem_y, elem_width, elem_height, font, color
                 )
             else:  # IMAGE
-                image_path = str(value) if value else ""
-                if image_path and self._project_path and not Path(image_path).is_absolute():
-                    image_path = str(Path(self._project_path) / image_path)
+                image_path = self._resolve_image_path(value)
                 self._render_image(
                     painter, image_path,
                     elem_x, elem_y, elem_width, elem_height
@@ -155,17 +319,242 @@ class ExportEngine:
         painter.end()
         return image
     
+    def _resolve_image_path(self, value) -> str:
+        """Resolve an image field value relative to the project folder."""
+        image_path = str(value) if value else ""
+        if image_path and self._project_path and not Path(image_path).is_absolute():
+            image_path = str(Path(self._project_path) / image_path)
+        return image_path
+    
+    def _draw_card_on_canvas(
+        self, c: pdf_canvas.Canvas, row: CardRow,
+        pdf_x: float, pdf_y: float, width: float, height: float,
+        render_scale: float
+    ) -> None:
+        """Draw a card directly onto a PDF canvas.
+        
+        Text fields become native PDF text so they stay sharp at any zoom,
+        and image fields embed the source file, which reportlab stores only
+        once per path. Text is rasterized only when its font has no built-in
+        PDF equivalent or installed TrueType file, or lacks its characters.
+        """
+        template = self._model.get_template()
+        scale = width / CARD_WIDTH
+        top = pdf_y + height
+        
+        c.setFillColor(self._pdf_color(template.background_color))
+        c.rect(pdf_x, pdf_y, width, height, stroke=0, fill=1)
+        
+        # Draw border
+        c.setStrokeColor(PDF_BORDER_COLOR)
+        c.setLineWidth(0.25)
+        c.rect(pdf_x, pdf_y, width, height, stroke=1, fill=0)
+        
+        # Look up every field value up front rather than per-field calls
+        data_get = row.data.get
+        fields = template.fields
+        values = [data_get(f.id, "") for f in fields]
+        
+        text_type = FieldType.TEXT
+        draw_placeholders = self._draw_placeholders
+        
+        for field, value in zip(fields, values):
+            if not value and not (draw_placeholders and field.field_type != text_type):
+                # Nothing to draw for empty text or image fields
+                continue
+            
+            elem_x = pdf_x + field.x * scale
+            elem_width = field.width * scale
+            elem_height = field.height * scale
+            elem_y = top - field.y * scale - elem_height
+            
+            if field.field_type == text_type:
+                text = str(value)
+                c.saveState()
+                clip = c.beginPath()
+                clip.rect(elem_x, elem_y, elem_width, elem_height)
+                c.clipPath(clip, stroke=0, fill=0)
+                font_name = self._pdf_font_name(field)
+                if font_name is not None and self._pdf_can_encode(text, font_name):
+                    self._draw_pdf_text(
+                        c, text, elem_x, elem_y, elem_height, field, font_name
+                    )
+                else:
+                    self._draw_pdf_text_raster(
+                        c, text, elem_x, elem_y, elem_width, elem_height,
+                        field, render_scale
+                    )
+                c.restoreState()
+            else:  # IMAGE
+                image_path = self._resolve_image_path(value)
+                if image_path and self._pdf_image_ok(image_path):
+                    c.drawImage(
+                        image_path, elem_x, elem_y, elem_width, elem_height,
+                        mask="auto", preserveAspectRatio=True, anchor="c"
+                    )
+                elif draw_placeholders:
+                    c.setStrokeColor(PDF_PLACEHOLDER_COLOR)
+                    c.setLineWidth(0.25)
+                    c.rect(elem_x, elem_y, elem_width, elem_height, stroke=1, fill=0)
+    
+    def _draw_pdf_text(
+        self, c: pdf_canvas.Canvas, text: str,
+        x: float, y: float, height: float, field: FieldDefinition,
+        font_name: str
+    ) -> None:
+        """Draw left-aligned, vertically centered text in a PDF font."""
+        # Field font sizes are points at 96 DPI preview pixels, which map
+        # one-to-one onto PDF points once the card is scaled to 3.5"
+        font_size = field.font_size
+        ascent, descent = getAscentDescent(font_name, font_size)
+        
+        lines = text.splitlines() or [text]
+        leading = font_size * 1.2
+        # Baseline of the first line so the block is centered in the field
+        block_height = (ascent - descent) + leading * (len(lines) - 1)
+        baseline = y + (height + block_height) / 2 - ascent
+        
+        c.setFont(font_name, font_size)
+        c.setFillColor(self._pdf_color(field.font_color))
+        for line in lines:
+            c.drawString(x, baseline, line)
+            baseline -= leading
+    
+    def _draw_pdf_text_raster(
+        self, c: pdf_canvas.Canvas, text: str,
+        x: float, y: float, width: float, height: float,
+        field: FieldDefinition, render_scale: float
+    ) -> None:
+        """Rasterize a text field no PDF font can represent."""
+        px_width = max(1, int(field.width * render_scale))
+        px_height = max(1, int(field.height * render_scale))
+        image = QImage(px_width, px_height, QImage.Format.Format_ARGB32)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        self._render_text(
+            painter, text, 0, 0, px_width, px_height,
+            self._field_font(field, render_scale), _qcolor(field.font_color)
+        )
+        painter.end()
+        
+        rgba = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        pil_image = Image.frombuffer(
+            "RGBA", (px_width, px_height), bytes(rgba.constBits()),
+            "raw", "RGBA", rgba.bytesPerLine(), 1
+        )
+        c.drawImage(ImageReader(pil_image), x, y, width, height, mask="auto")
+    
+    def _pdf_font_name(self, field: FieldDefinition) -> Optional[str]:
+        """Return the PDF font for a text field, or None to rasterize it."""
+        family = PDF_FONT_FAMILIES.get(field.font_family)
+        if family is not None:
+            return PDF_FONT_NAMES[(family, field.font_bold, field.font_italic)]
+        return _pdf_ttf_font(field.font_family, field.font_bold, field.font_italic)
+    
+    def _pdf_can_encode(self, text: str, font_name: str) -> bool:
+        """Check whether a PDF font has every character of the text."""
+        font = getFont(font_name)
+        if isinstance(font, TTFont):
+            char_to_glyph = font.face.charToGlyph
+            return all(ord(ch) in char_to_glyph for ch in text if ch not in "\r\n")
+        # The built-in fonts are WinAnsi encoded
+        try:
+            text.encode("cp1252")
+        except UnicodeEncodeError:
+            return False
+        return True
+    
+    def _pdf_image_ok(self, image_path: str) -> bool:
+        """Check once per export whether reportlab can read an image file."""
+        ok = self._pdf_images.get(image_path)
+        if ok is None:
+            try:
+                ImageReader(image_path).getSize()
+                ok = True
+            except Exception:
+                ok = False
+            self._pdf_images[image_path] = ok
+        return ok
+    
+    def _pdf_color(self, value: str):
+        """Convert a template color string to a reportlab color.
+        
+        Goes through QColor so #RGB, #AARRGGBB and named colors come out
+        as they do in the preview and the raster exports.
+        """
+        color = _qcolor(value)
+        if not color.isValid():
+            return black
+        return Color(color.redF(), color.greenF(), color.blueF(), color.alphaF())
+    
+    def _field_font(self, field: FieldDefinition, scale: float) -> QFont:
+        """Build the QFont for a text field at the given render scale."""
+        font = QFont(field.font_family, int(field.font_size * scale))
+        font.setBold(field.font_bold)
+        font.setItalic(field.font_italic)
+        return font
+    
+    def _get_field_styles(self, width: int, height: int) -> list[tuple[QFont, QColor]]:
+        """Return the (font, color) pair for each template field at a card size.
+        
+        Built once per template version, size and thread, so rendering many
+        rows doesn't go back to the font database for every field.
+        """
+        key = (
+            id(self._model.get_template()),
+            self._model.get_template_version(),
+            width, height,
+        )
+        style_cache = getattr(self._thread_styles, "cache", None)
+        if style_cache is None:
+            style_cache = self._thread_styles.cache = {}
+        styles = style_cache.get(key)
+        if styles is None:
+            scale = min(width / CARD_WIDTH, height / CARD_HEIGHT)
+            styles = [
+                (self._field_font(field, scale), _qcolor(field.font_color))
+                for field in self._model.get_template().fields
+            ]
+            style_cache[key] = styles
+        return styles
+    
+    def _get_field_rects(self, width: int, height: int) -> list[tuple[int, int, int, int]]:
+        """Return each template field's pixel rect (x, y, w, h) at a card size.
+        
+        Field geometry only changes with the template, so it is scaled once
+        per template version and size instead of once per row.
+        """
+        key = (
+            id(self._model.get_template()),
+            self._model.get_template_version(),
+            width, height,
+        )
+        with self._cache_lock:
+            rects = self._rect_cache.get(key)
+        if rects is None:
+            scale_x = width / CARD_WIDTH
+            scale_y = height / CARD_HEIGHT
+            rects = [
+                (
+                    int(field.x * scale_x), int(field.y * scale_y),
+                    int(field.width * scale_x), int(field.height * scale_y),
+                )
+                for field in self._model.get_template().fields
+            ]
+            with self._cache_lock:
+                rects = self._rect_cache.setdefault(key, rects)
+        return rects
+    
     def _render_text(
         self, painter: QPainter, text: str,
         x: int, y: int, width: int, height: int,
-        field: FieldDefinition, scale_x: float, scale_y: float
+        font: QFont, color: QColor
     ) -> None:
         """Render a text field."""
-        font = QFont(field.font_family, int(field.font_size * min(scale_x, scale_y)))
-        font.setBold(field.font_bold)
-        font.setItalic(field.font_italic)
         painter.setFont(font)
-        painter.setPen(QColor(field.font_color))
+        painter.setPen(color)
         
         rect = QRect(x, y, width, height)
         painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
@@ -174,42 +563,158 @@ class ExportEngine:
         self, painter: QPainter, image_path: str,
         x: int, y: int, width: int, height: int
     ) -> None:
-        """Render an image field."""
-        if not image_path:
-            painter.setPen(QColor("#999999"))
-            rect = QRect(x, y, width, height)
-            painter.drawRect(rect)
-            return
+        """Render an image field.
         
-        pixmap = QPixmap(image_path)
-        if pixmap.isNull():
-            painter.setPen(QColor("#999999"))
-            rect = QRect(x, y, width, height)
-            painter.drawRect(rect)
+        Uses QImage rather than QPixmap so cards can be rendered off the
+        GUI thread.
+        """
+        scaled = self._load_scaled_image(image_path, width, height) if image_path else None
+        if scaled is None:
+            if self._draw_placeholders:
+                painter.setPen(PLACEHOLDER_COLOR)
+                painter.drawRect(QRect(x, y, width, height))
             return
         
-        scaled = pixmap.scaled(
+        img_x = x + (width - scaled.width()) // 2
+        img_y = y + (height - scaled.height()) // 2
+        painter.drawImage(img_x, img_y, scaled)
+    
+    def _card_cache_key(self, row: CardRow, render_scale: float) -> tuple:
+        """Build the render cache key for a row at a given scale.
+        
+        Includes the project folder and the modification time of each image
+        the row shows, so replaced or edited image files render again.
+        """
+        template = self._model.get_template()
+        image_mtimes = []
+        for field in template.fields:
+            if field.field_type != FieldType.IMAGE:
+                continue
+            image_path = self._resolve_image_path(row.data.get(field.id))
+            try:
+                image_mtimes.append(os.stat(image_path).st_mtime_ns if image_path else None)
+            except OSError:
+                image_mtimes.append(None)
+        return (
+            id(template),
+            self._model.get_template_version(),
+            self._project_path,
+            tuple(sorted(row.data.items())),
+            tuple(image_mtimes),
+            render_scale,
+        )
+    
+    def _get_card_jpeg(self, row: CardRow, render_scale: float) -> bytes:
+        """Return the rendered card encoded as JPEG bytes for DOCX embedding.
+        
+        Rows with identical data under the same template version share a
+        single render, so duplicate rows and repeated exports are cheap.
+        """
+        key = self._card_cache_key(row, render_scale)
+        with self._cache_lock:
+            image_bytes = self._jpeg_cache.get(key)
+        if image_bytes is None:
+            card_image = self.render_card(
+                row, int(CARD_WIDTH * render_scale), int(CARD_HEIGHT * render_scale)
+            )
+            buffer = BytesIO()
+            self._qimage_to_pil(card_image).save(buffer, "JPEG", quality=90)
+            image_bytes = buffer.getvalue()
+            with self._cache_lock:
+                image_bytes = self._jpeg_cache.setdefault(key, image_bytes)
+        return image_bytes
+    
+    def _resolve_render_scale(self, render_scale: Optional[float]) -> float:
+        """Pick the render scale, dropping it for templates without images."""
+        if render_scale is not None:
+            return render_scale
+        template = self._model.get_template()
+        if any(f.field_type == FieldType.IMAGE for f in template.fields):
+            return DEFAULT_RENDER_SCALE
+        return TEXT_ONLY_RENDER_SCALE
+    
+    def _load_scaled_image(
+        self, image_path: str, width: int, height: int
+    ) -> Optional[QImage]:
+        """Load an image scaled to fit the given size, reusing earlier work.
+        
+        The same logo usually appears on every card, so each file is decoded
+        once and each target size scaled once. Returns None if the file is
+        missing or cannot be decoded.
+        
+        The result is the caller's own QImage instance sharing the cached
+        pixels, which is what lets several threads draw the same image.
+        """
+        abs_path = os.path.abspath(image_path)
+        try:
+            mtime = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            return None
+        
+        scaled_key = (abs_path, mtime, width, height)
+        with self._cache_lock:
+            scaled = self._scaled_cache.get(scaled_key)
+            if scaled is not None:
+                return QImage(scaled)
+            source = self._image_cache.get((abs_path, mtime))
+            if source is not None:
+                source = QImage(source)
+        if source is None:
+            source = QImage(abs_path)
+            with self._cache_lock:
+                source = QImage(self._image_cache.setdefault((abs_path, mtime), source))
+        if source.isNull():
+            return None
+        scaled = source.scaled(
             width, height,
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
-        
-        img_x = x + (width - scaled.width()) // 2
-        img_y = y + (height - scaled.height()) // 2
-        painter.drawPixmap(img_x, img_y, scaled)
+        # Store in the formats QPainter blits onto RGB32 cards without
+        # converting, so each draw is a plain copy or blend
+        if scaled.hasAlphaChannel():
+            scaled.convertTo(QImage.Format.Format_ARGB32_Premultiplied)
+        else:
+            scaled.convertTo(QImage.Format.Format_RGB32)
+        with self._cache_lock:
+            return QImage(self._scaled_cache.setdefault(scaled_key, scaled))
     
-    def _qimage_to_bytes(self, image: QImage) -> Optional[bytes]:
-        """Convert QImage to PNG bytes."""
-        from PySide6.QtCore import QBuffer, QIODevice
+    def _qimage_to_pil(self, image: QImage) -> Image.Image:
+        """Convert QImage to an RGB PIL image without an intermediate encode.
         
-        buffer = QBuffer()
-        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
-        if image.save(buffer, "PNG"):
-            return bytes(buffer.data())
-        return None
+        RGB32 images (what render_card produces) are read in place, with
+        PIL dropping the unused padding byte.
+        """
+        if image.format() == QImage.Format.Format_RGB32:
+            return Image.frombuffer(
+                "RGB", (image.width(), image.height()), bytes(image.constBits()),
+                "raw", RGB32_RAW_MODE, image.bytesPerLine(), 1
+            )
+        rgb = image.convertToFormat(QImage.Format.Format_RGB888)
+        return Image.frombuffer(
+            "RGB", (rgb.width(), rgb.height()), bytes(rgb.constBits()),
+            "raw", "RGB", rgb.bytesPerLine(), 1
+        )
     
-    def export_pdf(self, output_path: Path, cards_per_page: int) -> bool:
-        """Export cards to PDF with standard credit card size and cut lines."""
+    def export_pdf(
+        self, output_path: Path, cards_per_page: int,
+        render_scale: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> bool:
+        """Export cards to PDF with standard credit card size and cut lines.
+        
+        Args:
+            output_path: Destination PDF file.
+            cards_per_page: Number of cards per page (1, 2, 4, 6, 8 or 10).
+            render_scale: Raster scale for text no PDF font can
+                represent. Defaults to 2 (~192 DPI), or 1.5 for
+                templates without image fields.
+            progress: Called after each card is drawn. It may raise
+                ExportCancelled to stop before the file is written.
+        
+        Text is written as native PDF text and images embed their source
+        files, so the output stays sharp at any zoom level.
+        """
         rows = self._model.get_all_rows()
         if not rows:
             return False
@@ -225,78 +730,168 @@ class ExportEngine:
         card_width_pts = int(CARD_WIDTH_INCHES * POINTS_PER_INCH)
         card_height_pts = int(CARD_HEIGHT_INCHES * POINTS_PER_INCH)
         
-        # Cut line extension beyond card edge
-        cut_line_extend = 10
+        # Per-position geometry is identical on every page, so compute the
+        # PDF origin and the four cut-line segments once up front
+        slots = []
+        for pos in positions:
+            # PDF coordinates start from bottom-left
+            pdf_x = pos.x()
+            pdf_y = page_height - pos.y() - card_height_pts
+            cut_lines = self._cut_line_segments(
+                pdf_x, pdf_y, card_width_pts, card_height_pts, CUT_LINE_EXTEND
+            )
+            slots.append((pdf_x, pdf_y, cut_lines))
+        
+        render_scale = self._resolve_render_scale(render_scale)
         
-        row_index = 0
-        while row_index < len(rows):
-            page_rows = rows[row_index:row_index + cards_per_page]
+        pages = [rows[i:i + cards_per_page] for i in range(0, len(rows), cards_per_page)]
+        
+        done = 0
+        for page_idx, page_rows in enumerate(pages):
+            if page_idx > 0:
+                c.showPage()
             
-            for i, row in enumerate(page_rows):
-                if i >= len(positions):
-                    break
+            for row, (pdf_x, pdf_y, cut_lines) in zip(page_rows, slots):
+                self._draw_card_on_canvas(
+                    c, row, pdf_x, pdf_y,
+                    card_width_pts, card_height_pts, render_scale
+                )
                 
-                pos = positions[i]
+                # Draw cut lines (light gray dashed lines)
+                c.setStrokeColor(gray)
+                c.setLineWidth(0.5)
+                c.setDash(3, 3)  # Dashed line pattern
+                c.lines(cut_lines)
                 
-                # Render card at high resolution for quality
-                render_scale = 3
-                card_image = self.render_card(
-                    row, 
-                    int(CARD_WIDTH * render_scale), 
-                    int(CARD_HEIGHT * render_scale)
+                # Reset dash pattern
+                c.setDash()
+                
+                if progress is not None:
+                    done += 1
+                    progress(done, len(rows))
+        
+        c.save()
+        return True
+    
+    def export_pdf_raster_page(
+        self, output_path: Path, cards_per_page: int, dpi: int = 150,
+        progress: Optional[ProgressCallback] = None
+    ) -> bool:
+        """Export cards to PDF with each page embedded as a single image.
+        
+        Cards and cut lines are painted onto one page-sized raster, so every
+        page holds one image instead of per-card drawing commands. Files are
+        larger and text isn't selectable; prefer export_pdf unless a flat
+        image per page is wanted.
+        
+        Args:
+            output_path: Destination PDF file.
+            cards_per_page: Number of cards per page (1, 2, 4, 6, 8 or 10).
+            dpi: Page raster resolution.
+            progress: Called after each card is drawn, as in export_pdf.
+        """
+        rows = self._model.get_all_rows()
+        if not rows:
+            return False
+        
+        page_width = int(8.5 * POINTS_PER_INCH)
+        page_height = int(11 * POINTS_PER_INCH)
+        positions = self.calculate_layout(QSize(page_width, page_height), cards_per_page)
+        
+        # Pixels per PDF point, and the page and card sizes in pixels
+        px = dpi / POINTS_PER_INCH
+        page_px_width = round(page_width * px)
+        page_px_height = round(page_height * px)
+        card_px_width = round(CARD_WIDTH_INCHES * dpi)
+        card_px_height = round(CARD_HEIGHT_INCHES * dpi)
+        
+        # Card origins and cut lines in page pixels, shared by every page
+        slots = []
+        for pos in positions:
+            x = round(pos.x() * px)
+            y = round(pos.y() * px)
+            cut_lines = [
+                QLineF(*segment) for segment in self._cut_line_segments(
+                    x, y, card_px_width, card_px_height, CUT_LINE_EXTEND * px
                 )
+            ]
+            slots.append((x, y, cut_lines))
+        
+        # Light gray 0.5pt cut lines with 3pt dashes, as in export_pdf
+        cut_pen = QPen(QColor("#808080"))
+        cut_pen.setWidthF(max(1.0, 0.5 * px))
+        dash = 3 * px / cut_pen.widthF()
+        cut_pen.setDashPattern([dash, dash])
+        
+        # Duplicate rows share a render for the duration of the export
+        card_images: dict[tuple, QImage] = {}
+        
+        c = pdf_canvas.Canvas(str(output_path), pagesize=letter)
+        pages = [rows[i:i + cards_per_page] for i in range(0, len(rows), cards_per_page)]
+        
+        done = 0
+        for page_idx, page_rows in enumerate(pages):
+            if page_idx > 0:
+                c.showPage()
+            
+            page = QImage(page_px_width, page_px_height, QImage.Format.Format_RGB32)
+            page.fill(Qt.GlobalColor.white)
+            painter = QPainter(page)
+            
+            for row, (x, y, cut_lines) in zip(page_rows, slots):
+                key = self._card_cache_key(row, dpi)
+                card_image = card_images.get(key)
+                if card_image is None:
+                    card_image = self.render_card(row, card_px_width, card_px_height)
+                    card_images[key] = card_image
+                painter.drawImage(x, y, card_image)
                 
-                image_bytes = self._qimage_to_bytes(card_image)
-                if image_bytes:
-                    img_reader = ImageReader(BytesIO(image_bytes))
-                    # PDF coordinates start from bottom-left
-                    pdf_x = pos.x()
-                    pdf_y = page_height - pos.y() - card_height_pts
-                    
-                    c.drawImage(
-                        img_reader, pdf_x, pdf_y,
-                        width=card_width_pts, height=card_height_pts,
-                        preserveAspectRatio=False
-                    )
-                    
-                    # Draw cut lines (light gray dashed lines)
-                    c.setStrokeColor(gray)
-                    c.setLineWidth(0.5)
-                    c.setDash(3, 3)  # Dashed line pattern
-                    
-                    # Top cut line
-                    c.line(
-                        pdf_x - cut_line_extend, pdf_y + card_height_pts,
-                        pdf_x + card_width_pts + cut_line_extend, pdf_y + card_height_pts
-                    )
-                    # Bottom cut line
-                    c.line(
-                        pdf_x - cut_line_extend, pdf_y,
-                        pdf_x + card_width_pts + cut_line_extend, pdf_y
-                    )
-                    # Left cut line
-                    c.line(
-                        pdf_x, pdf_y - cut_line_extend,
-                        pdf_x, pdf_y + card_height_pts + cut_line_extend
-                    )
-                    # Right cut line
-                    c.line(
-                        pdf_x + card_width_pts, pdf_y - cut_line_extend,
-                        pdf_x + card_width_pts, pdf_y + card_height_pts + cut_line_extend
-                    )
-                    
-                    # Reset dash pattern
-                    c.setDash()
+                painter.setPen(cut_pen)
+                painter.drawLines(cut_lines)
+                
+                if progress is not None:
+                    done += 1
+                    progress(done, len(rows))
             
-            row_index += cards_per_page
-            if row_index < len(rows):
-                c.showPage()
+            painter.end()
+            c.drawImage(
+                ImageReader(self._qimage_to_pil(page)),
+                0, 0, page_width, page_height
+            )
         
         c.save()
         return True
     
-    def export_docx(self, output_path: Path, cards_per_page: int) -> bool:
-        """Export cards to Word document with standard credit card size."""
+    def _cut_line_segments(
+        self, x: float, y: float, width: float, height: float, extend: float
+    ) -> list[tuple[float, float, float, float]]:
+        """Return the four (x1, y1, x2, y2) cut lines around a card's edges."""
+        right = x + width
+        bottom = y + height
+        return [
+            # Along both horizontal edges, then both vertical edges
+            (x - extend, y, right + extend, y),
+            (x - extend, bottom, right + extend, bottom),
+            (x, y - extend, x, bottom + extend),
+            (right, y - extend, right, bottom + extend),
+        ]
+    
+    def export_docx(
+        self, output_path: Path, cards_per_page: int,
+        render_scale: Optional[float] = None,
+        progress: Optional[ProgressCallback] = None
+    ) -> bool:
+        """Export cards to Word document with standard credit card size.
+        
+        Args:
+            output_path: Destination DOCX file.
+            cards_per_page: Number of cards per page (1, 2, 4, 6, 8 or 10).
+            render_scale: Card raster scale relative to the preview. Defaults
+                to 2 (~192 DPI), or 1.5 for templates without image fields.
+                Use 3 or 4 for maximum print quality.
+            progress: Called after each card is placed. It may raise
+                ExportCancelled to stop before the file is written.
+        """
         from docx import Document
         from docx.shared import Inches, Pt
         from docx.enum.table import WD_TABLE_ALIGNMENT
@@ -308,15 +903,10 @@ class ExportEngine:
         if not rows:
             return False
         
-        layouts = {
-            1: (1, 1), 2: (1, 2), 4: (2, 2),
-            6: (2, 3), 8: (2, 4), 10: (2, 5)
-        }
-        
-        if cards_per_page not in layouts:
+        if cards_per_page not in CARD_LAYOUTS:
             raise ValueError(f"Unsupported cards_per_page: {cards_per_page}")
         
-        cols, table_rows = layouts[cards_per_page]
+        cols, table_rows = CARD_LAYOUTS[cards_per_page]
         
         doc = Document()
         for section in doc.sections:
@@ -325,73 +915,150 @@ class ExportEngine:
             section.left_margin = Inches(0.5)
             section.right_margin = Inches(0.5)
         
-        # Fixed card size - standard credit card
-        card_width_inches = CARD_WIDTH_INCHES
-        card_height_inches = CARD_HEIGHT_INCHES
+        # Fixed card size - standard credit card, converted to EMU once
+        card_width = Inches(CARD_WIDTH_INCHES)
+        card_height = Inches(CARD_HEIGHT_INCHES)
         
-        row_index = 0
-        page_count = 0
+        # Table cells in the order cards fill them
+        cell_slots = [(r, c) for r in range(table_rows) for c in range(cols)]
         
-        while row_index < len(rows):
-            if page_count > 0:
-                doc.add_page_break()
-            
-            page_rows = rows[row_index:row_index + cards_per_page]
-            table = doc.add_table(rows=table_rows, cols=cols)
-            table.alignment = WD_TABLE_ALIGNMENT.CENTER
-            
-            # Add thin borders for cut lines
-            tbl = table._tbl
-            tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
-                r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
-            )
-            # Light gray dashed borders for cut lines
-            tblBorders = parse_xml(
-                r'<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-                r'<w:top w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'<w:left w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'<w:bottom w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'<w:right w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'<w:insideH w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'<w:insideV w:val="dashed" w:sz="4" w:color="808080"/>'
-                r'</w:tblBorders>'
-            )
-            existing = tblPr.find('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tblBorders')
-            if existing is not None:
-                tblPr.remove(existing)
-            tblPr.append(tblBorders)
-            if tbl.tblPr is None:
-                tbl.insert(0, tblPr)
-            
-            card_idx = 0
-            for r in range(table_rows):
-                for c in range(cols):
-                    if card_idx < len(page_rows):
-                        row = page_rows[card_idx]
-                        cell = table.cell(r, c)
-                        
-                        # Set cell size to card size
-                        cell.width = Inches(card_width_inches)
-                        
-                        render_scale = 3
-                        card_image = self.render_card(
-                            row, int(CARD_WIDTH * render_scale), int(CARD_HEIGHT * render_scale)
-                        )
-                        
-                        image_bytes = self._qimage_to_bytes(card_image)
-                        if image_bytes:
-                            paragraph = cell.paragraphs[0]
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            run = paragraph.add_run()
-                            run.add_picture(
-                                BytesIO(image_bytes),
-                                width=Inches(card_width_inches),
-                                height=Inches(card_height_inches)
-                            )
-                        card_idx += 1
+        render_scale = self._resolve_render_scale(render_scale)
+        # Scale the field rects once before the workers start rendering.
+        # Fonts can't be shared between threads, so each worker builds its
+        # own on its first card.
+        self._get_field_rects(int(CARD_WIDTH * render_scale), int(CARD_HEIGHT * render_scale))
+        
+        def encode(row: CardRow) -> bytes:
+            return self._get_card_jpeg(row, render_scale)
+        
+        pages = [rows[i:i + cards_per_page] for i in range(0, len(rows), cards_per_page)]
+        
+        done = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            next_images = executor.map(encode, pages[0])
             
-            row_index += cards_per_page
-            page_count += 1
+            for page_idx in range(len(pages)):
+                if page_idx > 0:
+                    doc.add_page_break()
+                
+                # Queue the next page's renders so they overlap with building
+                # this page's table
+                card_images = next_images
+                if page_idx + 1 < len(pages):
+                    next_images = executor.map(encode, pages[page_idx + 1])
+                
+                table = doc.add_table(rows=table_rows, cols=cols)
+                table.alignment = WD_TABLE_ALIGNMENT.CENTER
+                
+                # Add thin borders for cut lines
+                tbl = table._tbl
+                tblPr = tbl.tblPr if tbl.tblPr is not None else parse_xml(
+                    r'<w:tblPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+                )
+                # Light gray dashed borders for cut lines
+                tblBorders = parse_xml(
+                    r'<w:tblBorders xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                    r'<w:top w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'<w:left w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'<w:bottom w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'<w:right w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'<w:insideH w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'<w:insideV w:val="dashed" w:sz="4" w:color="808080"/>'
+                    r'</w:tblBorders>'
+                )
+                existing = tblPr.find('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tblBorders')
+                if existing is not None:
+                    tblPr.remove(existing)
+                tblPr.append(tblBorders)
+                if tbl.tblPr is None:
+                    tbl.insert(0, tblPr)
+                
+                for image_bytes, (r, c) in zip(card_images, cell_slots):
+                    cell = table.cell(r, c)
+                    
+                    # Set cell size to card size
+                    cell.width = card_width
+                    
+                    paragraph = cell.paragraphs[0]
+                    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                    run = paragraph.add_run()
+                    run.add_picture(
+                        BytesIO(image_bytes),
+                        width=card_width,
+                        height=card_height
+                    )
+                    
+                    if progress is not None:
+                        done += 1
+                        progress(done, len(rows))
         
         doc.save(str(output_path))
         return True
+
+
+class ExportSignals(QObject):
+    """Signals for ExportWorker.
+    
+    Signals:
+        progress: Emitted with (cards done, total cards) as cards are drawn.
+        finished: Emitted with whether anything was exported.
+        cancelled: Emitted if the export was cancelled.
+        error: Emitted with a message if the export fails.
+    """
+    
+    progress = Signal(int, int)
+    finished = Signal(bool)
+    cancelled = Signal()
+    error = Signal(str)
+
+
+class ExportWorker(QRunnable):
+    """Runs an export on a thread pool thread.
+    
+    The signals object is created on the calling thread, so its signals are
+    delivered there through queued connections. The model must not change
+    while the export runs.
+    """
+    
+    def __init__(self, engine: ExportEngine, export_format: str,
+                 output_path: Path, cards_per_page: int):
+        """Initialize the worker.
+        
+        Args:
+            engine: The engine to export with.
+            export_format: "PDF" or "DOCX".
+            output_path: Destination file.
+            cards_per_page: Number of cards per page.
+        """
+        super().__init__()
+        self._engine = engine
+        self._export_format = export_format
+        self._output_path = output_path
+        self._cards_per_page = cards_per_page
+        self._cancel_requested = False
+        self.signals = ExportSignals()
+    
+    def cancel(self) -> None:
+        """Stop the export after the current card."""
+        self._cancel_requested = True
+    
+    def _on_progress(self, done: int, total: int) -> None:
+        if self._cancel_requested:
+            raise ExportCancelled()
+        self.signals.progress.emit(done, total)
+    
+    def run(self) -> None:
+        if self._export_format == "PDF":
+            export = self._engine.export_pdf
+        else:
+            export = self._engine.export_docx
+        try:
+            success = export(
+                self._output_path, self._cards_per_page, progress=self._on_progress
+            )
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(success)
@@ -0,0 +1,56 @@
+"""Copying picked images into a project folder.
+
+The copy runs on a thread pool thread through ImageCopyWorker, so large
+images or slow drives don't block the UI. The project always gets an
+independent copy: a hardlink would tie the project asset to the user's
+original, so editing either file would change both.
+"""
+
+import shutil
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class ImageCopySignals(QObject):
+    """Signals for ImageCopyWorker.
+    
+    Signals:
+        finished: Emitted after the copy (source path, row_id, field_id,
+            path of the copy relative to the project folder).
+        error: Emitted with a message if the copy fails.
+    """
+    
+    finished = Signal(str, str, str, str)
+    error = Signal(str)
+
+
+class ImageCopyWorker(QRunnable):
+    """Copies one image file on a thread pool thread.
+    
+    The signals object is created on the calling thread, so its signals are
+    delivered there through queued connections.
+    """
+    
+    def __init__(self, source: str, dest: Path, relative_path: str,
+                 row_id: str, field_id: str):
+        super().__init__()
+        self._source = source
+        self._dest = dest
+        self._relative_path = relative_path
+        self._row_id = row_id
+        self._field_id = field_id
+        self.signals = ImageCopySignals()
+    
+    def run(self) -> None:
+        try:
+            # copyfile uses the platform's fast copy path (sendfile and the
+            # like) and skips copy2's metadata copying, which a derived
+            # project asset doesn't need
+            shutil.copyfile(self._source, self._dest)
+        except OSError as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(
+                self._source, self._row_id, self._field_id, self._relative_path
+            )
@@ -4,10 +4,12 @@ This module contains the core data structures for representing business cards,
 their fields, and layout templates.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from typing import Optional, Any
-import uuid
+import re
+import secrets
+import sys
 
 
 class FieldType(Enum):
@@ -16,14 +18,82 @@ class FieldType(Enum):
     IMAGE = "image"
 
 
-@dataclass
+def _new_id() -> str:
+    """Return a new random 32-character hex ID for a field or row.
+    
+    Same 128 bits of randomness as a UUID4 string, without building a UUID
+    object to format it.
+    """
+    return secrets.token_hex(16)
+
+
+# Serialized value -> FieldType, avoiding Enum's call machinery on load
+_FIELD_TYPES = {field_type.value: field_type for field_type in FieldType}
+
+# #RGB, #RRGGBB, #AARRGGBB, #RRRGGGBBB and #RRRRGGGGBBBB, the hex forms
+# QColor parses
+_HEX_COLOR = re.compile(r"#(?:[0-9A-Fa-f]{3}){1,4}|#[0-9A-Fa-f]{8}")
+
+# The SVG color keywords QColor accepts by name (QColor.colorNames()),
+# matched ignoring case and spaces as Qt does
+_COLOR_NAMES = frozenset("""
+    aliceblue antiquewhite aqua aquamarine azure beige bisque black
+    blanchedalmond blue blueviolet brown burlywood cadetblue chartreuse
+    chocolate coral cornflowerblue cornsilk crimson cyan darkblue
+    darkcyan darkgoldenrod darkgray darkgreen darkgrey darkkhaki
+    darkmagenta darkolivegreen darkorange darkorchid darkred darksalmon
+    darkseagreen darkslateblue darkslategray darkslategrey darkturquoise
+    darkviolet deeppink deepskyblue dimgray dimgrey dodgerblue firebrick
+    floralwhite forestgreen fuchsia gainsboro ghostwhite gold goldenrod
+    gray green greenyellow grey honeydew hotpink indianred indigo ivory
+    khaki lavender lavenderblush lawngreen lemonchiffon lightblue
+    lightcoral lightcyan lightgoldenrodyellow lightgray lightgreen
+    lightgrey lightpink lightsalmon lightseagreen lightskyblue
+    lightslategray lightslategrey lightsteelblue lightyellow lime
+    limegreen linen magenta maroon mediumaquamarine mediumblue
+    mediumorchid mediumpurple mediumseagreen mediumslateblue
+    mediumspringgreen mediumturquoise mediumvioletred midnightblue
+    mintcream mistyrose moccasin navajowhite navy oldlace olive
+    olivedrab orange orangered orchid palegoldenrod palegreen
+    paleturquoise palevioletred papayawhip peachpuff peru pink plum
+    powderblue purple red rosybrown royalblue saddlebrown salmon
+    sandybrown seagreen seashell sienna silver skyblue slateblue
+    slategray slategrey snow springgreen steelblue tan teal thistle
+    tomato transparent turquoise violet wheat white whitesmoke yellow
+    yellowgreen
+""".split())
+
+
+def _valid_color(value: Any, default: str) -> str:
+    """Return a loaded color if Qt can parse it, otherwise the default.
+    
+    Any form QColor accepts is kept (#RGB, #AARRGGBB, named colors, ...).
+    Colors end up in Qt stylesheets, where a malformed value only fails
+    late and silently, so unparseable values are replaced when loading.
+    The check mirrors Qt's rules so loading a project never needs QtGui.
+    """
+    if not isinstance(value, str):
+        return default
+    if _HEX_COLOR.fullmatch(value):
+        return value
+    if value.replace(" ", "").lower() in _COLOR_NAMES:
+        return value
+    return default
+
+
+def _interned(value: Any) -> Any:
+    """Return an interned copy of a loaded string; other values unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class FieldDefinition:
     """Definition of a field/column in the card template.
     
     This defines what data can be entered (appears as a column in the table)
     and how it appears on the card preview.
     """
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     name: str = ""
     field_type: FieldType = FieldType.TEXT
     x: int = 0
@@ -56,43 +126,53 @@ class FieldDefinition:
     @classmethod
     def from_dict(cls, data: dict) -> "FieldDefinition":
         """Deserialize from dictionary."""
+        get = data.get
+        field_type = data["field_type"]
         return cls(
             id=data["id"],
             name=data["name"],
-            field_type=FieldType(data["field_type"]),
-            x=data.get("x", 0), y=data.get("y", 0),
-            width=data.get("width", 100), height=data.get("height", 30),
-            font_size=data.get("font_size", 12),
-            font_color=data.get("font_color", "#000000"),
-            font_family=data.get("font_family", "Arial"),
-            font_bold=data.get("font_bold", False),
-            font_italic=data.get("font_italic", False),
-            z_index=data.get("z_index", 0)
+            # Unknown values fall through to FieldType() to raise ValueError
+            field_type=_FIELD_TYPES.get(field_type) or FieldType(field_type),
+            x=get("x", 0), y=get("y", 0),
+            width=get("width", 100), height=get("height", 30),
+            font_size=get("font_size", 12),
+            # Interned: a template repeats a few families and colors, and they
+            # key the font and stylesheet caches
+            font_color=sys.intern(_valid_color(get("font_color"), "#000000")),
+            font_family=_interned(get("font_family", "Arial")),
+            font_bold=get("font_bold", False),
+            font_italic=get("font_italic", False),
+            z_index=get("z_index", 0)
         )
     
-    def copy(self) -> "FieldDefinition":
-        """Create a copy of this field with a new ID."""
-        return FieldDefinition(
-            id=str(uuid.uuid4()),
-            name=self.name,
-            field_type=self.field_type,
-            x=self.x, y=self.y,
-            width=self.width, height=self.height,
-            font_size=self.font_size,
-            font_color=self.font_color,
-            font_family=self.font_family,
-            font_bold=self.font_bold,
-            font_italic=self.font_italic,
-            z_index=self.z_index
-        )
+    def copy(self, **changes: Any) -> "FieldDefinition":
+        """Create a copy of this field with a new ID.
+        
+        Args:
+            **changes: Field values to override in the copy.
+        """
+        return replace(self, id=_new_id(), **changes)
 
 
-@dataclass 
+@dataclass(slots=True)
 class CardTemplate:
     """Template defining the structure and layout of business cards."""
     fields: list[FieldDefinition] = field(default_factory=list)
     background_color: str = "#FFFFFF"
     
+    # ID and name -> field. Kept in sync by add_field(), remove_field() and
+    # set_fields(); after editing fields or their names in place, call
+    # reindex().
+    _by_id: dict[str, FieldDefinition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_name: dict[str, FieldDefinition] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        self._rebuild_index()
+    
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
         return {
@@ -105,28 +185,64 @@ class CardTemplate:
         """Deserialize from dictionary."""
         return cls(
             fields=[FieldDefinition.from_dict(f) for f in data.get("fields", [])],
-            background_color=data.get("background_color", "#FFFFFF")
+            background_color=_valid_color(data.get("background_color"), "#FFFFFF")
         )
     
+    def _rebuild_index(self) -> None:
+        """Rebuild the ID and name indexes from the field list."""
+        fields = self.fields
+        self._by_id = {f.id: f for f in fields}
+        # First field wins for duplicate names, as with a linear scan
+        by_name: dict[str, FieldDefinition] = {}
+        for f in fields:
+            by_name.setdefault(f.name, f)
+        self._by_name = by_name
+    
+    def reindex(self) -> None:
+        """Refresh the lookups after fields were edited in place, e.g. renamed."""
+        self._rebuild_index()
+    
+    def set_fields(self, fields: list[FieldDefinition]) -> None:
+        """Replace all fields, rebuilding the lookup indexes."""
+        self.fields = list(fields)
+        self._rebuild_index()
+    
+    def add_field(self, field_def: FieldDefinition) -> None:
+        """Append a field, keeping the lookup indexes in sync."""
+        self.fields.append(field_def)
+        self._by_id[field_def.id] = field_def
+        self._by_name.setdefault(field_def.name, field_def)
+    
+    def remove_field(self, field_id: str) -> Optional[int]:
+        """Remove a field by ID, returning its former position or None."""
+        field_def = self._by_id.get(field_id)
+        if field_def is None:
+            return None
+        for idx, f in enumerate(self.fields):
+            if f is field_def:
+                del self.fields[idx]
+                break
+        else:
+            # Dropped from the list without going through remove_field()
+            self._rebuild_index()
+            return None
+        # Another field with the same name may take over the name lookup
+        self._rebuild_index()
+        return idx
+    
     def get_field_by_id(self, field_id: str) -> Optional[FieldDefinition]:
         """Get a field definition by its ID."""
-        for f in self.fields:
-            if f.id == field_id:
-                return f
-        return None
+        return self._by_id.get(field_id)
     
     def get_field_by_name(self, name: str) -> Optional[FieldDefinition]:
         """Get a field definition by its name."""
-        for f in self.fields:
-            if f.name == name:
-                return f
-        return None
+        return self._by_name.get(name)
 
 
-@dataclass
+@dataclass(slots=True)
 class CardRow:
     """A single row of card data (one business card's content)."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     data: dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
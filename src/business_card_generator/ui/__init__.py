@@ -1,9 +1,16 @@
 """Qt UI widgets for the business card generator."""
 
-from src.business_card_generator.ui.card_designer import CardDesigner
-from src.business_card_generator.ui.card_table_view import CardTableView, CardTableWidget
-from src.business_card_generator.ui.details_bar import DetailsBar
-from src.business_card_generator.ui.main_window import MainWindow
+import importlib
+
+# Widgets are imported on first access, so importing one ui submodule
+# doesn't pull in every other widget (and main_window's dependencies)
+_LAZY_ATTRS = {
+    "CardDesigner": "card_designer",
+    "CardTableView": "card_table_view",
+    "CardTableWidget": "card_table_view",
+    "DetailsBar": "details_bar",
+    "MainWindow": "main_window",
+}
 
 __all__ = [
     "CardDesigner",
@@ -12,3 +19,16 @@ __all__ = [
     "DetailsBar",
     "MainWindow",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
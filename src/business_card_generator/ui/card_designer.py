@@ -4,23 +4,67 @@ This module provides the CardDesigner widget that displays a card preview
 based on the template layout and selected row data.
 """
 
-from pathlib import Path
+import os
+from functools import lru_cache, partial
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPixmap, QAction
+from PySide6.QtCore import QPoint, QRectF, QTimer, Qt, Signal
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPixmap, QPixmapCache, QAction
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFrame, QLabel, QMenu
 )
 
 from src.business_card_generator.models.card import FieldDefinition, FieldType, CardRow
 from src.business_card_generator.core.card_data_model import CardDataModel
+from src.business_card_generator.core.constants import CARD_WIDTH, CARD_HEIGHT
 
 
-# Standard business card dimensions (in pixels at 96 DPI)
-# Standard card is 3.5" x 2" = 336 x 192 pixels
-CARD_WIDTH = 336
-CARD_HEIGHT = 192
+# Shortest interval between drag moves, about one 60 Hz frame
+DRAG_FRAME_MS = 16
+
+
+@lru_cache(maxsize=64)
+def _make_font(family: str, size: int, bold: bool, italic: bool) -> QFont:
+    """Build a font once per distinct setting and share it across widgets.
+    
+    QFont is implicitly shared, so handing the same instance to several
+    setFont() calls is safe.
+    """
+    font = QFont(family, size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+def _scaled_pixmap(path: str, width: int, height: int) -> Optional[QPixmap]:
+    """Load an image scaled to fit the given size, or None if unreadable.
+    
+    Both the decoded image and each scaled size are kept in QPixmapCache,
+    so flipping between rows that share images doesn't decode or resample
+    them again. Keys include the file's mtime, so an image replaced or
+    edited on disk is loaded again.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    key = f"{path}|{mtime}|{width}x{height}"
+    scaled = QPixmapCache.find(key)
+    if scaled is None:
+        source_key = f"{path}|{mtime}|source"
+        source = QPixmapCache.find(source_key)
+        if source is None:
+            source = QPixmap(path)
+            if source.isNull():
+                return None
+            QPixmapCache.insert(source_key, source)
+        scaled = source.scaled(
+            width, height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        QPixmapCache.insert(key, scaled)
+    return scaled
 
 
 class FieldWidget(QLabel):
@@ -33,17 +77,37 @@ class FieldWidget(QLabel):
     selected = Signal(str)  # field_id
     context_menu_requested = Signal(str, object)  # field_id, QPoint (global pos)
     
+    # Stylesheets keyed by (font_color, selected), shared by all widgets
+    _stylesheets: dict[tuple[str, bool], str] = {}
+    
     def __init__(self, field_def: FieldDefinition, parent: QWidget = None):
         super().__init__(parent)
         self._field_def = field_def
         self._dragging = False
         self._drag_start = None
+        self._selected = False
+        
+        # Drag moves are coalesced to at most one per frame
+        self._pending_pos: Optional[QPoint] = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(DRAG_FRAME_MS)
+        self._move_timer.timeout.connect(self._apply_pending_move)
+        
+        # Last applied geometry, style and name, so update_from() only
+        # touches what changed
+        self._applied_geometry: Optional[tuple[int, int, int, int]] = None
+        self._applied_style: Optional[tuple] = None
+        self._applied_name: Optional[str] = None
+        self._applied_sheet: Optional[str] = None
+        # (field_type, z_index) as of the designer's last full sync, which
+        # is what its type split and stacking order are based on
+        self.synced_layout: Optional[tuple[FieldType, int]] = None
         
-        self.setGeometry(field_def.x, field_def.y, field_def.width, field_def.height)
-        self._update_style()
-        self.setToolTip(f"{field_def.name} - drag to reposition, right-click for options")
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._on_context_menu)
+        self.update_from(field_def)
     
     @property
     def field_def(self) -> FieldDefinition:
@@ -57,52 +121,81 @@ class FieldWidget(QLabel):
     def set_value(self, value: str) -> None:
         """Set the displayed value."""
         if self._field_def.field_type == FieldType.IMAGE:
-            if value:
-                pixmap = QPixmap(value)
-                if not pixmap.isNull():
-                    scaled = pixmap.scaled(
-                        self._field_def.width, self._field_def.height,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    self.setPixmap(scaled)
-                else:
-                    self.setText(f"[{self._field_def.name}]")
-            else:
-                self.setText(f"[{self._field_def.name}]")
+            self.set_image(value)
         else:
-            self.setText(value if value else f"[{self._field_def.name}]")
+            self.set_text(value)
+    
+    def set_text(self, value: str) -> None:
+        """Show a text value, or the field name when empty."""
+        self.setText(value if value else f"[{self._field_def.name}]")
+    
+    def set_image(self, path: str) -> None:
+        """Show an image file, or the field name when missing or unreadable."""
+        scaled = None
+        if path:
+            scaled = _scaled_pixmap(path, self._field_def.width, self._field_def.height)
+        if scaled is not None:
+            self.setPixmap(scaled)
+        else:
+            self.setText(f"[{self._field_def.name}]")
+    
+    def update_from(self, field_def: FieldDefinition) -> None:
+        """Sync geometry, style and tooltip with a field definition.
+        
+        Each part is only reapplied when its values differ from the last
+        sync, so refreshing an unchanged widget is cheap.
+        """
+        self._field_def = fd = field_def
+        
+        geometry = (fd.x, fd.y, fd.width, fd.height)
+        if geometry != self._applied_geometry:
+            self.setGeometry(*geometry)
+            self._applied_geometry = geometry
+        
+        style = (fd.font_family, fd.font_size, fd.font_bold, fd.font_italic, fd.font_color)
+        if style != self._applied_style:
+            self._update_style()
+            self._applied_style = style
+        
+        if fd.name != self._applied_name:
+            self.setToolTip(f"{fd.name} - drag to reposition, right-click for options")
+            self._applied_name = fd.name
     
     def _update_style(self) -> None:
         """Update widget style based on field definition."""
         fd = self._field_def
-        font = QFont(fd.font_family, fd.font_size)
-        font.setBold(fd.font_bold)
-        font.setItalic(fd.font_italic)
-        self.setFont(font)
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                color: {fd.font_color};
-                background-color: transparent;
-                border: 1px dashed #cccccc;
-                padding: 2px;
-            }}
-        """)
-        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        self.setFont(_make_font(fd.font_family, fd.font_size, fd.font_bold, fd.font_italic))
+        self._apply_stylesheet()
     
     def set_selected(self, selected: bool) -> None:
         """Set selection state."""
-        fd = self._field_def
-        border = "2px solid #0078d4" if selected else "1px dashed #cccccc"
-        self.setStyleSheet(f"""
+        if selected == self._selected:
+            return
+        self._selected = selected
+        self._apply_stylesheet()
+    
+    def _apply_stylesheet(self) -> None:
+        """Apply the label stylesheet for the current color and selection.
+        
+        setStyleSheet() re-parses and re-polishes the widget, so it is only
+        called when the sheet actually differs from the applied one.
+        """
+        key = (self._field_def.font_color, self._selected)
+        sheet = self._stylesheets.get(key)
+        if sheet is None:
+            border = "2px solid #0078d4" if self._selected else "1px dashed #cccccc"
+            sheet = f"""
             QLabel {{
-                color: {fd.font_color};
+                color: {key[0]};
                 background-color: transparent;
                 border: {border};
                 padding: 2px;
             }}
-        """)
+        """
+            self._stylesheets[key] = sheet
+        if sheet != self._applied_sheet:
+            self.setStyleSheet(sheet)
+            self._applied_sheet = sheet
     
     def mousePressEvent(self, event) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
@@ -116,12 +209,22 @@ class FieldWidget(QLabel):
             delta = event.pos() - self._drag_start
             new_x = max(0, min(self.x() + delta.x(), CARD_WIDTH - self.width()))
             new_y = max(0, min(self.y() + delta.y(), CARD_HEIGHT - self.height()))
-            self.move(new_x, new_y)
+            self._pending_pos = QPoint(new_x, new_y)
+            if not self._move_timer.isActive():
+                self._move_timer.start()
         super().mouseMoveEvent(event)
     
+    def _apply_pending_move(self) -> None:
+        """Move to the latest drag position queued by mouseMoveEvent."""
+        if self._pending_pos is not None:
+            self.move(self._pending_pos)
+            self._pending_pos = None
+    
     def mouseReleaseEvent(self, event) -> None:
         if self._dragging:
             self._dragging = False
+            self._move_timer.stop()
+            self._apply_pending_move()
             self._field_def.x = self.x()
             self._field_def.y = self.y()
             self.position_changed.emit(self._field_def.id, self.x(), self.y())
@@ -142,22 +245,47 @@ class CardCanvas(QFrame):
         """)
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Plain)
         self.setToolTip("Business card preview - drag fields to reposition")
+        
+        # The grid never changes, so it is drawn once into a pixmap
+        self._grid_pixmap: Optional[QPixmap] = None
+    
+    def _get_grid_pixmap(self) -> QPixmap:
+        """Return the grid pixmap, rendering it for the current DPI if needed."""
+        dpr = self.devicePixelRatioF()
+        if self._grid_pixmap is None or self._grid_pixmap.devicePixelRatio() != dpr:
+            pixmap = QPixmap(round(CARD_WIDTH * dpr), round(CARD_HEIGHT * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            
+            # Draw subtle grid
+            pen = QPen(QColor(240, 240, 240))
+            pen.setStyle(Qt.PenStyle.DotLine)
+            painter.setPen(pen)
+            
+            for x in range(50, CARD_WIDTH, 50):
+                painter.drawLine(x, 0, x, CARD_HEIGHT)
+            for y in range(50, CARD_HEIGHT, 50):
+                painter.drawLine(0, y, CARD_WIDTH, y)
+            
+            painter.end()
+            self._grid_pixmap = pixmap
+        return self._grid_pixmap
     
     def paintEvent(self, event) -> None:
         super().paintEvent(event)
+        # Only blit the part of the grid Qt asked to repaint
+        exposed = event.rect()
+        grid = self._get_grid_pixmap()
+        dpr = grid.devicePixelRatio()
+        source = QRectF(
+            exposed.x() * dpr, exposed.y() * dpr,
+            exposed.width() * dpr, exposed.height() * dpr
+        )
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw subtle grid
-        pen = QPen(QColor(240, 240, 240))
-        pen.setStyle(Qt.PenStyle.DotLine)
-        painter.setPen(pen)
-        
-        for x in range(50, CARD_WIDTH, 50):
-            painter.drawLine(x, 0, x, CARD_HEIGHT)
-        for y in range(50, CARD_HEIGHT, 50):
-            painter.drawLine(0, y, CARD_WIDTH, y)
-        
+        painter.drawPixmap(QRectF(exposed), grid, source)
         painter.end()
 
 
@@ -184,15 +312,32 @@ class CardDesigner(QWidget):
         self._model: Optional[CardDataModel] = None
         self._current_row: Optional[CardRow] = None
         self._field_widgets: dict[str, FieldWidget] = {}
+        # (field_id, widget) pairs by field type, rebuilt with the widgets
+        self._text_widgets: list[tuple[str, FieldWidget]] = []
+        self._image_widgets: list[tuple[str, FieldWidget]] = []
         self._selected_field_id: Optional[str] = None
         self._project_path: Optional[str] = None  # For resolving relative image paths
+        self._resolved_paths: dict[str, str] = {}  # Image value -> resolved path
         self._clipboard: Optional[FieldDefinition] = None  # For copy/paste
+        self._ctx_field_id: Optional[str] = None  # Field the context menu is open for
         
         self._setup_ui()
+        self._setup_context_menu()
     
     def set_project_path(self, path: Optional[str]) -> None:
         """Set the project path for resolving relative image paths."""
         self._project_path = path
+        self._resolved_paths.clear()
+    
+    def _resolve_image_path(self, value: str) -> str:
+        """Resolve an image value against the project folder, memoized."""
+        resolved = self._resolved_paths.get(value)
+        if resolved is None:
+            resolved = value
+            if self._project_path and not os.path.isabs(value):
+                resolved = os.path.join(self._project_path, value)
+            self._resolved_paths[value] = resolved
+        return resolved
     
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -225,73 +370,129 @@ class CardDesigner(QWidget):
     def _on_template_changed(self) -> None:
         """Handle template structure changes."""
         self._rebuild_field_widgets()
-        if self._current_row:
-            self._update_field_values()
+        self._update_field_values()
     
     def _rebuild_field_widgets(self) -> None:
-        """Rebuild all field widgets from the template."""
-        # Clear existing widgets
-        for widget in self._field_widgets.values():
-            widget.deleteLater()
-        self._field_widgets.clear()
-        self._selected_field_id = None
-        
-        if not self._model:
+        """Sync field widgets with the template.
+        
+        Widgets for fields that still exist are updated in place; only
+        widgets for removed fields are deleted and only new fields get new
+        widgets.
+        """
+        sorted_fields = self._model.get_fields_sorted_by_z_index() if self._model else []
+        new_ids = {f.id for f in sorted_fields}
+        
+        self._canvas.setUpdatesEnabled(False)
+        try:
+            # Remove widgets for fields that are gone
+            for field_id in [fid for fid in self._field_widgets if fid not in new_ids]:
+                self._field_widgets.pop(field_id).deleteLater()
+            if self._selected_field_id not in new_ids:
+                self._selected_field_id = None
+            
+            # Stacking order the canvas will have without any restacking:
+            # kept widgets in their current order, then new widgets created
+            # on top in z-order
+            stacked = list(self._field_widgets)
+            
+            for field_def in sorted_fields:
+                widget = self._field_widgets.get(field_def.id)
+                if widget is not None:
+                    widget.update_from(field_def)
+                    widget.synced_layout = (field_def.field_type, field_def.z_index)
+                    continue
+                widget = FieldWidget(field_def, self._canvas)
+                # Widgets live on the GUI thread with us, so skip the
+                # per-emit thread check of auto connections
+                direct = Qt.ConnectionType.DirectConnection
+                widget.position_changed.connect(self._on_field_position_changed, direct)
+                widget.selected.connect(self._on_field_selected, direct)
+                widget.context_menu_requested.connect(self._show_context_menu, direct)
+                widget.show()
+                widget.synced_layout = (field_def.field_type, field_def.z_index)
+                self._field_widgets[field_def.id] = widget
+                stacked.append(field_def.id)
+            
+            # Restack only if the z-order changed
+            ordered_ids = [f.id for f in sorted_fields]
+            if stacked != ordered_ids:
+                for field_id in ordered_ids:
+                    self._field_widgets[field_id].raise_()
+            # Keep the dict in z-order for the next comparison
+            self._field_widgets = {fid: self._field_widgets[fid] for fid in ordered_ids}
+            
+            # Split by type once so value updates need no per-field dispatch
+            self._text_widgets = [
+                (f.id, self._field_widgets[f.id])
+                for f in sorted_fields if f.field_type == FieldType.TEXT
+            ]
+            self._image_widgets = [
+                (f.id, self._field_widgets[f.id])
+                for f in sorted_fields if f.field_type != FieldType.TEXT
+            ]
+        finally:
+            self._canvas.setUpdatesEnabled(True)
+    
+    def update_field(self, field_id: str) -> None:
+        """Refresh the widget of one field after its definition was edited.
+        
+        Falls back to a full sync if the field has no widget yet or its
+        type or stacking changed.
+        """
+        field_def = self._model.get_field_by_id(field_id) if self._model else None
+        widget = self._field_widgets.get(field_id)
+        if (field_def is None or widget is None
+                or widget.synced_layout != (field_def.field_type, field_def.z_index)):
+            self._rebuild_field_widgets()
+            self._update_field_values()
             return
         
-        # Create widget for each field, sorted by z_index
-        sorted_fields = self._model.get_fields_sorted_by_z_index()
-        for field_def in sorted_fields:
-            widget = FieldWidget(field_def, self._canvas)
-            widget.position_changed.connect(self._on_field_position_changed)
-            widget.selected.connect(self._on_field_selected)
-            widget.context_menu_requested.connect(self._show_context_menu)
-            widget.show()
-            self._field_widgets[field_def.id] = widget
-        
-        # Ensure z-order is correct by raising widgets in order
-        for field_def in sorted_fields:
-            if field_def.id in self._field_widgets:
-                self._field_widgets[field_def.id].raise_()
+        widget.update_from(field_def)
+        # Size and name affect image scaling and the placeholder text
+        value = self._current_row.data.get(field_id) if self._current_row else None
+        if field_def.field_type == FieldType.TEXT:
+            widget.set_text(str(value) if value else "")
+        else:
+            widget.set_image(self._resolve_image_path(str(value)) if value else "")
+    
+    def _setup_context_menu(self) -> None:
+        """Build the field context menu once; actions act on _ctx_field_id."""
+        self._ctx_menu = QMenu(self)
+        self._ctx_actions: dict[str, QAction] = {}
+        
+        entries = [
+            ("copy", "Copy", self._copy_field),
+            ("cut", "Cut", self._cut_field),
+            ("paste", "Paste", None),
+            None,
+            ("bring_to_front", "Bring to Front", self._bring_to_front),
+            ("bring_forward", "Bring Forward", self._bring_forward),
+            ("send_backward", "Send Backward", self._send_backward),
+            ("send_to_back", "Send to Back", self._send_to_back),
+        ]
+        for entry in entries:
+            if entry is None:
+                self._ctx_menu.addSeparator()
+                continue
+            key, text, handler = entry
+            action = QAction(text, self)
+            if handler is None:
+                action.triggered.connect(self._paste_field)
+            else:
+                action.triggered.connect(partial(self._run_ctx_action, handler))
+            self._ctx_menu.addAction(action)
+            self._ctx_actions[key] = action
+    
+    def _run_ctx_action(self, handler, checked: bool = False) -> None:
+        """Apply a context menu action to the field it was opened for."""
+        if self._ctx_field_id is not None:
+            handler(self._ctx_field_id)
     
     def _show_context_menu(self, field_id: str, global_pos) -> None:
         """Show context menu for a field."""
-        menu = QMenu(self)
-        
-        # Copy/Cut/Paste actions
-        copy_action = QAction("Copy", self)
-        copy_action.triggered.connect(lambda: self._copy_field(field_id))
-        menu.addAction(copy_action)
-        
-        cut_action = QAction("Cut", self)
-        cut_action.triggered.connect(lambda: self._cut_field(field_id))
-        menu.addAction(cut_action)
-        
-        paste_action = QAction("Paste", self)
-        paste_action.setEnabled(self._clipboard is not None)
-        paste_action.triggered.connect(self._paste_field)
-        menu.addAction(paste_action)
-        
-        menu.addSeparator()
-        
-        # Z-order actions
-        bring_front_action = QAction("Bring to Front", self)
-        bring_front_action.triggered.connect(lambda: self._bring_to_front(field_id))
-        menu.addAction(bring_front_action)
-        
-        bring_forward_action = QAction("Bring Forward", self)
-        bring_forward_action.triggered.connect(lambda: self._bring_forward(field_id))
-        menu.addAction(bring_forward_action)
-        
-        send_backward_action = QAction("Send Backward", self)
-        send_backward_action.triggered.connect(lambda: self._send_backward(field_id))
-        menu.addAction(send_backward_action)
-        
-        send_back_action = QAction("Send to Back", self)
-        send_back_action.triggered.connect(lambda: self._send_to_back(field_id))
-        menu.addAction(send_back_action)
-        
-        menu.exec(global_pos)
+        self._ctx_field_id = field_id
+        self._ctx_actions["paste"].setEnabled(self._clipboard is not None)
+        self._ctx_menu.exec(global_pos)
     
     def _copy_field(self, field_id: str) -> None:
         """Copy a field to clipboard."""
@@ -311,23 +512,21 @@ class CardDesigner(QWidget):
         if not self._clipboard or not self._model:
             return
         
-        # Create a copy of the clipboard field
-        new_field = self._clipboard.copy()
-        
-        # Generate unique name
-        new_field.name = self._model.get_unique_field_name(self._clipboard.name)
-        
-        # Center the field in the preview
-        new_field.x = (CARD_WIDTH - new_field.width) // 2
-        new_field.y = (CARD_HEIGHT - new_field.height) // 2
-        
-        # Set z_index to be on top
-        new_field.z_index = self._model.get_max_z_index() + 1
-        
-        # Add to model
+        # Copy the clipboard field with a unique name, centered in the
+        # preview and on top of the other fields
+        clipboard = self._clipboard
+        new_field = clipboard.copy(
+            name=self._model.get_unique_field_name(clipboard.name),
+            x=(CARD_WIDTH - clipboard.width) // 2,
+            y=(CARD_HEIGHT - clipboard.height) // 2,
+            z_index=self._model.get_max_z_index() + 1,
+        )
+        
+        # The z_index is set before adding, so this is a single template
+        # change and a single widget sync
         self._model.add_field_definition(new_field)
         
-        # Select the new field
+        # Select the new field once its widget exists
         self._on_field_selected(new_field.id)
         self.field_added.emit(new_field.id)
     
@@ -363,16 +562,18 @@ class CardDesigner(QWidget):
     
     def _update_field_values(self) -> None:
         """Update field widgets with current row data."""
-        for field_id, widget in self._field_widgets.items():
-            if self._current_row:
-                value = self._current_row.get_value(field_id)
-                # Resolve relative paths for images
-                if value and self._project_path and widget.field_def.field_type == FieldType.IMAGE:
-                    if not Path(value).is_absolute():
-                        value = str(Path(self._project_path) / value)
-                widget.set_value(str(value) if value else "")
-            else:
-                widget.set_value("")
+        row = self._current_row
+        data = row.data if row else {}
+        
+        for field_id, widget in self._text_widgets:
+            value = data.get(field_id)
+            widget.set_text(str(value) if value else "")
+        
+        resolve = self._resolve_image_path
+        for field_id, widget in self._image_widgets:
+            value = data.get(field_id)
+            # Resolve relative paths for images
+            widget.set_image(resolve(str(value)) if value else "")
     
     def _on_field_position_changed(self, field_id: str, x: int, y: int) -> None:
         """Handle field widget position change."""
@@ -4,14 +4,20 @@ This module provides a table view where columns are defined by the template
 fields and rows are individual card data entries.
 """
 
+import os
 from typing import Optional
 
 from PySide6.QtCore import (
+    QEvent,
     QItemSelection,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
     Signal,
 )
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QStyledItemDelegate,
     QHeaderView,
     QTableView,
     QWidget,
@@ -26,7 +32,50 @@ from PySide6.QtWidgets import (
 )
 
 from ..core.card_data_model import CardDataModel
-from ..models.card import FieldType
+from ..models.card import FieldDefinition, FieldType
+
+
+# Fixed row height and the column width reported as a size hint; hints
+# are constant so Qt never measures every cell in a column or row
+ROW_HEIGHT = 30
+COLUMN_WIDTH_HINT = 120
+
+# Image picker filter; uppercase patterns too, as matching is
+# case-sensitive on some platforms
+_IMAGE_FILTER = (
+    "Images (*.png *.jpg *.jpeg *.gif *.bmp *.PNG *.JPG *.JPEG *.GIF *.BMP)"
+)
+
+
+class ImageCellDelegate(QStyledItemDelegate):
+    """Delegate for image columns that reports clicks on its cells.
+    
+    Only image columns use it, so clicks on text cells never reach its
+    editorEvent. The view calls clear_press() on every left release, so a
+    press whose release landed on another cell can't complete a click.
+    """
+    
+    image_clicked = Signal(QPersistentModelIndex)
+    
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._pressed = QPersistentModelIndex()
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseButtonPress:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self._pressed = QPersistentModelIndex(index)
+        elif event_type == QEvent.Type.MouseButtonRelease:
+            # A click is a left press and release on the same cell
+            if event.button() == Qt.MouseButton.LeftButton and self._pressed == index:
+                pressed, self._pressed = self._pressed, QPersistentModelIndex()
+                self.image_clicked.emit(pressed)
+        return super().editorEvent(event, model, option, index)
+    
+    def clear_press(self) -> None:
+        """Forget the pressed cell, e.g. after a release anywhere in the view."""
+        self._pressed = QPersistentModelIndex()
 
 
 class CardTableWidget(QWidget):
@@ -77,8 +126,8 @@ class CardTableWidget(QWidget):
         self._add_field_btn = QPushButton("+ Add Field")
         self._add_field_btn.setToolTip("Add a new field/column")
         add_field_menu = QMenu(self)
-        add_field_menu.addAction("Text Field", lambda: self._on_add_field(FieldType.TEXT))
-        add_field_menu.addAction("Image Field", lambda: self._on_add_field(FieldType.IMAGE))
+        add_field_menu.addAction("Text Field", self._on_add_text_field)
+        add_field_menu.addAction("Image Field", self._on_add_image_field)
         self._add_field_btn.setMenu(add_field_menu)
         row_layout.addWidget(self._add_field_btn)
         
@@ -114,6 +163,12 @@ class CardTableWidget(QWidget):
                 self.row_removed.emit(row_id)
                 self._remove_row_btn.setEnabled(False)
     
+    def _on_add_text_field(self) -> None:
+        self._on_add_field(FieldType.TEXT)
+    
+    def _on_add_image_field(self) -> None:
+        self._on_add_field(FieldType.IMAGE)
+    
     def _on_add_field(self, field_type: FieldType) -> None:
         name, ok = QInputDialog.getText(
             self, "Add Field",
@@ -127,14 +182,19 @@ class CardTableWidget(QWidget):
         if not fields:
             return
         
-        field_names = [f.name for f in fields]
+        # Name -> field in one pass; the first field wins for duplicate
+        # names, matching CardTemplate.get_field_by_name
+        fields_by_name: dict[str, FieldDefinition] = {}
+        for f in fields:
+            fields_by_name.setdefault(f.name, f)
+        
         name, ok = QInputDialog.getItem(
             self, "Remove Field",
             "Select field to remove:",
-            field_names, 0, False
+            list(fields_by_name), 0, False
         )
         if ok and name:
-            field = self._model.get_template().get_field_by_name(name)
+            field = fields_by_name.get(name)
             if field:
                 reply = QMessageBox.question(
                     self, "Remove Field",
@@ -176,14 +236,30 @@ class CardTableView(QTableView):
     def __init__(self, model: CardDataModel, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self._model = model
+        # Column -> field and image column lookups, rebuilt with the headers
+        self._col_to_field: list[FieldDefinition] = []
+        self._image_cols: set[int] = set()
+        self._image_delegate = ImageCellDelegate(self)
+        # Queued, so the file dialog opens after the view has finished
+        # handling the mouse release rather than from inside it
+        self._image_delegate.image_clicked.connect(
+            self._on_cell_clicked, Qt.ConnectionType.QueuedConnection
+        )
+        # Start image dialogs where the last image was picked
+        self._last_image_dir = ""
         
         self.setModel(model)
         self.setToolTip("Card data - double-click to edit, click image cells to select file")
         
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.setAlternatingRowColors(True)
-        self.setShowGrid(True)
+        # Grid lines and alternating rows are off by default to keep
+        # painting cheap on large tables; see set_high_performance_mode
+        self.set_high_performance_mode(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerItem)
+        # Cells stay on one line, so every row has the same fixed height
+        self.setWordWrap(False)
+        self.setTextElideMode(Qt.TextElideMode.ElideRight)
         
         # Connect selection
         sel_model = self.selectionModel()
@@ -193,9 +269,16 @@ class CardTableView(QTableView):
         # Connect to template changes to reconfigure headers
         model.template_changed.connect(self._configure_headers)
         self._configure_headers()
+    
+    def set_high_performance_mode(self, enabled: bool) -> None:
+        """Turn off grid lines and alternating row colors for faster painting.
         
-        # Handle clicks on image columns
-        self.clicked.connect(self._on_cell_clicked)
+        Args:
+            enabled: True for plain rows, False to draw the grid and
+                alternating row colors again.
+        """
+        self.setShowGrid(not enabled)
+        self.setAlternatingRowColors(not enabled)
     
     def _configure_headers(self) -> None:
         h_header = self.horizontalHeader()
@@ -204,40 +287,78 @@ class CardTableView(QTableView):
         
         v_header = self.verticalHeader()
         if v_header:
-            v_header.setDefaultSectionSize(30)
+            v_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            v_header.setMinimumSectionSize(ROW_HEIGHT)
+            v_header.setDefaultSectionSize(ROW_HEIGHT)
+        
+        self._rebuild_col_cache()
+    
+    def sizeHintForColumn(self, column: int) -> int:
+        return COLUMN_WIDTH_HINT
+    
+    def sizeHintForRow(self, row: int) -> int:
+        return ROW_HEIGHT
+    
+    def _rebuild_col_cache(self) -> None:
+        """Refresh the column lookups from the model's template."""
+        self._col_to_field = self._model.get_all_fields()
+        image_cols = {
+            col for col, field in enumerate(self._col_to_field)
+            if field.field_type == FieldType.IMAGE
+        }
+        # Image columns get the click-reporting delegate, the rest the default
+        for col in self._image_cols - image_cols:
+            self.setItemDelegateForColumn(col, None)
+        for col in image_cols:
+            self.setItemDelegateForColumn(col, self._image_delegate)
+        self._image_cols = image_cols
     
     def _on_selection_changed(self, selected: QItemSelection, deselected: QItemSelection) -> None:
-        indexes = selected.indexes()
-        if indexes:
-            row_idx = indexes[0].row()
-            row_id = self._model.get_row_id_at_index(row_idx)
+        # Read the first range instead of expanding it into one index per column
+        if not selected.isEmpty():
+            row_id = self._model.get_row_id_at_index(selected.first().top())
             if row_id:
                 self.row_selected.emit(row_id)
     
-    def _on_cell_clicked(self, index) -> None:
-        """Handle cell click - open file dialog for image fields."""
+    def mouseReleaseEvent(self, event) -> None:
+        super().mouseReleaseEvent(event)
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._image_delegate.clear_press()
+    
+    def _on_cell_clicked(self, index: QPersistentModelIndex) -> None:
+        """Handle image cell click - open file dialog for the field."""
+        if not index.isValid():
+            # The row or column went away before the click was delivered
+            return
         col = index.column()
-        field = self._model.get_field_at_column(col)
-        if field and field.field_type == FieldType.IMAGE:
+        if col in self._image_cols:
+            field = self._col_to_field[col]
             file_path, _ = QFileDialog.getOpenFileName(
                 self, f"Select {field.name}",
-                "", "Images (*.png *.jpg *.jpeg *.gif *.bmp)"
+                self._last_image_dir, _IMAGE_FILTER,
+                options=(
+                    QFileDialog.Option.ReadOnly
+                    | QFileDialog.Option.DontUseCustomDirectoryIcons
+                )
             )
             if file_path:
+                self._last_image_dir = os.path.dirname(file_path)
                 # Store the path - MainWindow will handle copying to project folder
                 self._model.setData(index, file_path)
                 self.image_selected.emit(file_path, index.row(), field.id)
     
     def get_selected_row_id(self) -> Optional[str]:
-        indexes = self.selectedIndexes()
-        if indexes:
-            row_idx = indexes[0].row()
-            return self._model.get_row_id_at_index(row_idx)
+        sel_model = self.selectionModel()
+        if sel_model is None:
+            return None
+        rows = sel_model.selectedRows()
+        if rows:
+            return self._model.get_row_id_at_index(rows[0].row())
         return None
     
     def select_row_by_id(self, row_id: str) -> bool:
-        for idx in range(self._model.rowCount()):
-            if self._model.get_row_id_at_index(idx) == row_id:
-                self.selectRow(idx)
-                return True
-        return False
+        idx = self._model.index_of_row_id(row_id)
+        if idx is None:
+            return False
+        self.selectRow(idx)
+        return True
@@ -4,9 +4,10 @@ This module provides the DetailsBar widget that displays and allows editing
 of the selected field's styling properties (font, color, size, etc.).
 """
 
+from contextlib import ExitStack
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QWidget,
@@ -28,11 +29,46 @@ from PySide6.QtWidgets import (
 from src.business_card_generator.models.card import FieldDefinition, FieldType
 
 
+# Quiet period before a burst of editor changes is reported as one
+# field_changed, so spinning a value doesn't redraw the card per step
+FIELD_CHANGE_DEBOUNCE_MS = 50
+
+_DETAILS_BAR_QSS = """
+    DetailsBar { background-color: #f8f8f8; }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+"""
+
+# ColorButton stylesheet; c is the button color, t the text color
+_COLOR_BTN_QSS_TMPL = """
+    QPushButton {{
+        background-color: {c};
+        color: {t};
+        border: 1px solid #888888;
+        border-radius: 3px;
+    }}
+    QPushButton:hover {{ border: 2px solid #0078d4; }}
+"""
+
+
 class ColorButton(QPushButton):
     """A button that displays and allows selection of a color."""
     
     color_changed = Signal(str)
     
+    # Color string -> (text color, stylesheet), shared by all buttons
+    _STYLE_CACHE: dict[str, tuple[str, str]] = {}
+    
     def __init__(self, initial_color: str = "#000000", parent: QWidget = None):
         super().__init__(parent)
         self._color = initial_color
@@ -51,18 +87,16 @@ class ColorButton(QPushButton):
         self._update_style()
     
     def _update_style(self) -> None:
-        qcolor = QColor(self._color)
-        luminance = (0.299 * qcolor.red() + 0.587 * qcolor.green() + 0.114 * qcolor.blue()) / 255
-        text_color = "#000000" if luminance > 0.5 else "#FFFFFF"
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self._color};
-                color: {text_color};
-                border: 1px solid #888888;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{ border: 2px solid #0078d4; }}
-        """)
+        cached = ColorButton._STYLE_CACHE.get(self._color)
+        if cached is None:
+            r, g, b, _ = QColor(self._color).getRgb()
+            # Rec. 601 luma in 1/256 steps (77, 150, 29); above half of
+            # 255 * 256 the background is light
+            luma = 77 * r + 150 * g + 29 * b
+            text_color = "#000000" if luma > 32640 else "#FFFFFF"
+            sheet = _COLOR_BTN_QSS_TMPL.format(c=self._color, t=text_color)
+            cached = ColorButton._STYLE_CACHE[self._color] = (text_color, sheet)
+        self.setStyleSheet(cached[1])
         self.setText(self._color)
     
     def _on_clicked(self) -> None:
@@ -87,7 +121,12 @@ class DetailsBar(QWidget):
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
         self._current_field: Optional[FieldDefinition] = None
-        self._updating = False
+        self._form_built = False
+        self._pending_field_id: Optional[str] = None
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(FIELD_CHANGE_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self.flush_pending)
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -121,6 +160,21 @@ class DetailsBar(QWidget):
         self._placeholder.setWordWrap(True)
         content_layout.addWidget(self._placeholder)
         
+        # The form is built on the first set_field()
+        self._content_layout = content_layout
+        
+        scroll_area.setWidget(content)
+        main_layout.addWidget(scroll_area)
+        
+        self.setMinimumWidth(250)
+        self.setToolTip("Edit properties of the selected field")
+        self.setStyleSheet(_DETAILS_BAR_QSS)
+    
+    def _ensure_form_built(self) -> None:
+        """Build the property form and wire its signals, once."""
+        if self._form_built:
+            return
+        
         # Form container
         self._form = QWidget()
         form_layout = QVBoxLayout(self._form)
@@ -148,25 +202,25 @@ class DetailsBar(QWidget):
         self._x_spin = QSpinBox()
         self._x_spin.setRange(0, 336)
         self._x_spin.setToolTip("X position on card")
-        self._x_spin.valueChanged.connect(lambda v: self._on_property_changed("x", v))
+        self._x_spin.valueChanged.connect(self._on_property_changed)
         pos_layout.addRow("X:", self._x_spin)
         
         self._y_spin = QSpinBox()
         self._y_spin.setRange(0, 192)
         self._y_spin.setToolTip("Y position on card")
-        self._y_spin.valueChanged.connect(lambda v: self._on_property_changed("y", v))
+        self._y_spin.valueChanged.connect(self._on_property_changed)
         pos_layout.addRow("Y:", self._y_spin)
         
         self._width_spin = QSpinBox()
         self._width_spin.setRange(10, 336)
         self._width_spin.setToolTip("Field width")
-        self._width_spin.valueChanged.connect(lambda v: self._on_property_changed("width", v))
+        self._width_spin.valueChanged.connect(self._on_property_changed)
         pos_layout.addRow("Width:", self._width_spin)
         
         self._height_spin = QSpinBox()
         self._height_spin.setRange(10, 192)
         self._height_spin.setToolTip("Field height")
-        self._height_spin.valueChanged.connect(lambda v: self._on_property_changed("height", v))
+        self._height_spin.valueChanged.connect(self._on_property_changed)
         pos_layout.addRow("Height:", self._height_spin)
         
         form_layout.addWidget(pos_group)
@@ -181,18 +235,14 @@ class DetailsBar(QWidget):
             "Verdana", "Courier New", "Trebuchet MS"
         ])
         self._font_family.setToolTip("Font family")
-        self._font_family.currentTextChanged.connect(
-            lambda v: self._on_property_changed("font_family", v)
-        )
+        self._font_family.currentTextChanged.connect(self._on_property_changed)
         style_layout.addRow("Font:", self._font_family)
         
         self._font_size = QSpinBox()
         self._font_size.setRange(6, 72)
         self._font_size.setSuffix(" pt")
         self._font_size.setToolTip("Font size")
-        self._font_size.valueChanged.connect(
-            lambda v: self._on_property_changed("font_size", v)
-        )
+        self._font_size.valueChanged.connect(self._on_property_changed)
         style_layout.addRow("Size:", self._font_size)
         
         style_widget = QWidget()
@@ -200,59 +250,51 @@ class DetailsBar(QWidget):
         style_h_layout.setContentsMargins(0, 0, 0, 0)
         
         self._bold_check = QCheckBox("Bold")
-        self._bold_check.stateChanged.connect(
-            lambda s: self._on_property_changed("font_bold", s == 2)
-        )
+        self._bold_check.toggled.connect(self._on_property_changed)
         style_h_layout.addWidget(self._bold_check)
         
         self._italic_check = QCheckBox("Italic")
-        self._italic_check.stateChanged.connect(
-            lambda s: self._on_property_changed("font_italic", s == 2)
-        )
+        self._italic_check.toggled.connect(self._on_property_changed)
         style_h_layout.addWidget(self._italic_check)
         style_h_layout.addStretch()
         
         style_layout.addRow("Style:", style_widget)
         
         self._font_color = ColorButton("#000000")
-        self._font_color.color_changed.connect(
-            lambda c: self._on_property_changed("font_color", c)
-        )
+        self._font_color.color_changed.connect(self._on_property_changed)
         style_layout.addRow("Color:", self._font_color)
         
         form_layout.addWidget(self._style_group)
         form_layout.addStretch()
         
-        self._form.hide()
-        content_layout.addWidget(self._form)
-        
-        scroll_area.setWidget(content)
-        main_layout.addWidget(scroll_area)
-        
-        self.setMinimumWidth(250)
-        self.setToolTip("Edit properties of the selected field")
-        self.setStyleSheet("""
-            DetailsBar { background-color: #f8f8f8; }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        self._content_layout.addWidget(self._form)
+        # Editor -> the field attribute it edits, for _on_property_changed
+        self._widget_to_prop = {
+            self._x_spin: "x",
+            self._y_spin: "y",
+            self._width_spin: "width",
+            self._height_spin: "height",
+            self._font_family: "font_family",
+            self._font_size: "font_size",
+            self._bold_check: "font_bold",
+            self._italic_check: "font_italic",
+            self._font_color: "font_color",
+        }
+        # Editors whose signals are blocked while set_field() fills them in
+        self._editors = [self._name_edit, *self._widget_to_prop]
+        self._form_built = True
     
     def set_field(self, field: FieldDefinition) -> None:
         """Display and edit the given field's properties."""
+        self._ensure_form_built()
+        if field is not self._current_field:
+            self.flush_pending()
         self._current_field = field
-        self._updating = True
         
-        try:
+        with ExitStack() as stack:
+            for editor in self._editors:
+                stack.enter_context(QSignalBlocker(editor))
+            
             self._name_edit.setText(field.name)
             self._type_label.setText("Text" if field.field_type == FieldType.TEXT else "Image")
             
@@ -272,31 +314,48 @@ class DetailsBar(QWidget):
             
             self._placeholder.hide()
             self._form.show()
-        finally:
-            self._updating = False
     
     def _on_name_changed(self) -> None:
         """Handle name field editing finished."""
-        if self._updating or not self._current_field:
+        if not self._current_field:
             return
         
         new_name = self._name_edit.text().strip()
         if new_name and new_name != self._current_field.name:
             self._current_field.name = new_name
-            self.field_changed.emit(self._current_field.id)
+            # Renames are reported right away, with any held-back edits
+            self._pending_field_id = self._current_field.id
+            self.flush_pending()
     
     def clear(self) -> None:
         """Clear the form and show placeholder."""
+        self.flush_pending()
         self._current_field = None
-        self._form.hide()
+        if self._form_built:
+            self._form.hide()
         self._placeholder.show()
     
-    def _on_property_changed(self, prop: str, value) -> None:
-        if self._updating or not self._current_field:
+    def _on_property_changed(self, value) -> None:
+        """Apply an editor's new value to the field attribute it edits."""
+        if not self._current_field:
             return
         
+        prop = self._widget_to_prop[self.sender()]
         setattr(self._current_field, prop, value)
-        self.field_changed.emit(self._current_field.id)
+        self._pending_field_id = self._current_field.id
+        self._emit_timer.start()
+    
+    def flush_pending(self) -> None:
+        """Emit the field_changed held back by the debounce timer, if any.
+        
+        Call before anything that reads the template, such as saving or
+        exporting, or replaces it, so the last edit is not lost or reported
+        against the wrong template.
+        """
+        self._emit_timer.stop()
+        field_id, self._pending_field_id = self._pending_field_id, None
+        if field_id is not None:
+            self.field_changed.emit(field_id)
     
     def get_current_field(self) -> Optional[FieldDefinition]:
         return self._current_field
@@ -5,13 +5,15 @@ application window, containing the CardDesigner, CardTableWidget, and
 DetailsBar in a splitter layout.
 """
 
+import hashlib
 import json
-import shutil
+import os
 import uuid
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QThreadPool, QTimer, QUrl
 from PySide6.QtGui import QCloseEvent, QKeySequence, QAction, QDesktopServices
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -23,19 +25,33 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QDialog,
     QListWidget,
+    QListWidgetItem,
     QDialogButtonBox,
     QLabel,
     QComboBox,
     QFormLayout,
+    QProgressDialog,
 )
 
 from src.business_card_generator.core.card_data_model import CardDataModel
+from src.business_card_generator.core.excel_import import ExcelImportWorker, ExcelSheet
+from src.business_card_generator.core.image_copy import ImageCopySignals, ImageCopyWorker
 from src.business_card_generator.models.card import CardTemplate, CardRow
 from src.business_card_generator.ui.card_designer import CardDesigner
 from src.business_card_generator.ui.card_table_view import CardTableWidget
 from src.business_card_generator.ui.details_bar import DetailsBar
 
 
+# Delay for coalescing window title updates after edits
+TITLE_UPDATE_MS = 50
+
+# Shortcuts without a fitting QKeySequence.StandardKey, parsed once at import.
+# StandardKey.Quit has no binding on Windows, so Ctrl+Q is spelled out.
+SHORTCUT_IMPORT = QKeySequence("Ctrl+I")
+SHORTCUT_EXPORT = QKeySequence("Ctrl+E")
+SHORTCUT_QUIT = QKeySequence("Ctrl+Q")
+
+
 class MainWindow(QMainWindow):
     """Main application window with three-panel layout.
     
@@ -62,6 +78,21 @@ class MainWindow(QMainWindow):
         self._details_bar: Optional[DetailsBar] = None
         self._splitter: Optional[QSplitter] = None
         self._menu_actions: dict[str, QAction] = {}
+        self._import_progress: Optional[QProgressDialog] = None
+        self._import_signals = None  # Signals of the running Excel import
+        self._copy_signals: set[ImageCopySignals] = set()  # Running image copies
+        self._export_progress: Optional[QProgressDialog] = None
+        self._export_worker = None  # Running ExportWorker
+        # (BASE_DIR mtime_ns, project names) from the last _list_projects scan
+        self._projects_cache: Optional[tuple[int, list[str]]] = None
+        # (project file, content digest) of the last write by _save_to_disk
+        self._last_saved: Optional[tuple[Path, bytes]] = None
+        
+        # Bursts of edits update the window title once
+        self._title_timer = QTimer(self)
+        self._title_timer.setSingleShot(True)
+        self._title_timer.setInterval(TITLE_UPDATE_MS)
+        self._title_timer.timeout.connect(self._update_title)
         
         self._setup_ui()
         self._setup_menu()
@@ -101,7 +132,7 @@ class MainWindow(QMainWindow):
         
         # New Project
         new_action = QAction("&New Project", self)
-        new_action.setShortcut(QKeySequence("Ctrl+N"))
+        new_action.setShortcut(QKeySequence.StandardKey.New)
         new_action.setToolTip("Create a new project (Ctrl+N)")
         new_action.triggered.connect(self._on_new_project)
         file_menu.addAction(new_action)
@@ -109,7 +140,7 @@ class MainWindow(QMainWindow):
         
         # Open Project
         open_action = QAction("&Open Project", self)
-        open_action.setShortcut(QKeySequence("Ctrl+O"))
+        open_action.setShortcut(QKeySequence.StandardKey.Open)
         open_action.setToolTip("Open an existing project (Ctrl+O)")
         open_action.triggered.connect(self._on_open_project)
         file_menu.addAction(open_action)
@@ -117,7 +148,7 @@ class MainWindow(QMainWindow):
         
         # Save Project
         save_action = QAction("&Save Project", self)
-        save_action.setShortcut(QKeySequence("Ctrl+S"))
+        save_action.setShortcut(QKeySequence.StandardKey.Save)
         save_action.setToolTip("Save the current project (Ctrl+S)")
         save_action.triggered.connect(self._on_save_project)
         file_menu.addAction(save_action)
@@ -127,7 +158,7 @@ class MainWindow(QMainWindow):
         
         # Import from Excel
         import_action = QAction("&Import from Excel...", self)
-        import_action.setShortcut(QKeySequence("Ctrl+I"))
+        import_action.setShortcut(SHORTCUT_IMPORT)
         import_action.setToolTip("Import card data from Excel file (Ctrl+I)")
         import_action.triggered.connect(self._on_import_excel)
         file_menu.addAction(import_action)
@@ -135,7 +166,7 @@ class MainWindow(QMainWindow):
         
         # Export
         export_action = QAction("&Export...", self)
-        export_action.setShortcut(QKeySequence("Ctrl+E"))
+        export_action.setShortcut(SHORTCUT_EXPORT)
         export_action.setToolTip("Export cards to PDF or Word (Ctrl+E)")
         export_action.triggered.connect(self._on_export)
         file_menu.addAction(export_action)
@@ -145,29 +176,32 @@ class MainWindow(QMainWindow):
         
         # Exit
         exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
+        exit_action.setShortcut(SHORTCUT_QUIT)
         exit_action.setToolTip("Exit the application (Ctrl+Q)")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         self._menu_actions["exit"] = exit_action
     
     def _connect_signals(self) -> None:
+        # Unique connections make an accidental second connect a no-op
+        unique = Qt.ConnectionType.UniqueConnection
+        
         # Table row selection -> update card preview
-        self._card_table_widget.row_selected.connect(self._on_row_selected)
-        self._card_table_widget.row_added.connect(self._on_row_added)
-        self._card_table_widget.row_removed.connect(self._on_row_removed)
-        self._card_table_widget.image_selected.connect(self._on_image_selected)
+        self._card_table_widget.row_selected.connect(self._on_row_selected, unique)
+        self._card_table_widget.row_added.connect(self._on_row_added, unique)
+        self._card_table_widget.row_removed.connect(self._on_row_removed, unique)
+        self._card_table_widget.image_selected.connect(self._on_image_selected, unique)
         
         # Designer field selection -> update details bar
-        self._card_designer.field_selected.connect(self._on_field_selected)
-        self._card_designer.field_position_changed.connect(self._on_field_position_changed)
+        self._card_designer.field_selected.connect(self._on_field_selected, unique)
+        self._card_designer.field_position_changed.connect(self._on_field_position_changed, unique)
         
         # Details bar changes -> update designer
-        self._details_bar.field_changed.connect(self._on_field_changed)
+        self._details_bar.field_changed.connect(self._on_field_changed, unique)
         
         # Model changes -> mark unsaved
-        self._model.dataChanged.connect(self._mark_unsaved)
-        self._model.template_changed.connect(self._mark_unsaved)
+        self._model.dataChanged.connect(self._mark_unsaved, unique)
+        self._model.template_changed.connect(self._mark_unsaved, unique)
     
     def _on_row_selected(self, row_id: str) -> None:
         """Handle row selection - update card preview."""
@@ -203,23 +237,42 @@ class MainWindow(QMainWindow):
         unique_name = f"{uuid.uuid4().hex[:8]}_{source.name}"
         dest = images_dir / unique_name
         
-        try:
-            shutil.copy2(source, dest)
-            
-            # Update the model with the relative path
-            row = self._model.get_row_at_index(row_index)
-            if row:
-                relative_path = f"images/{unique_name}"
-                row.set_value(field_id, relative_path)
-                
-                # Refresh the designer if this row is selected
-                selected_id = self._card_table_widget.get_selected_row_id()
-                if selected_id == row.id:
-                    self._card_designer.set_row(row)
-                
-                self._mark_unsaved()
-        except OSError as e:
-            QMessageBox.warning(self, "Warning", f"Could not copy image: {e}")
+        row = self._model.get_row_at_index(row_index)
+        if not row:
+            return
+        
+        # Copy on a worker thread; the model is updated in _on_image_copied
+        worker = ImageCopyWorker(
+            file_path, dest, f"images/{unique_name}", row.id, field_id
+        )
+        worker.signals.finished.connect(self._on_image_copied)
+        worker.signals.error.connect(self._on_image_copy_failed)
+        # Keep the signals object alive until the worker reports back
+        self._copy_signals.add(worker.signals)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_image_copied(self, source: str, row_id: str, field_id: str,
+                         relative_path: str) -> None:
+        """Point the cell at the project copy of an image."""
+        self._copy_signals.discard(self.sender())
+        row = self._model.get_row(row_id)
+        # Skip if the row is gone or the cell was changed during the copy
+        if not row or row.get_value(field_id) != source:
+            return
+        
+        # Update the model with the relative path
+        row.set_value(field_id, relative_path)
+        
+        # Refresh the designer if this row is selected
+        selected_id = self._card_table_widget.get_selected_row_id()
+        if selected_id == row.id:
+            self._card_designer.set_row(row)
+        
+        self._mark_unsaved()
+    
+    def _on_image_copy_failed(self, message: str) -> None:
+        self._copy_signals.discard(self.sender())
+        QMessageBox.warning(self, "Warning", f"Could not copy image: {message}")
     
     def _on_field_selected(self, field_id: str) -> None:
         """Handle field selection in designer - show in details bar."""
@@ -237,17 +290,15 @@ class MainWindow(QMainWindow):
     
     def _on_field_changed(self, field_id: str) -> None:
         """Handle field property change from details bar."""
-        # Rebuild designer to reflect changes
-        self._card_designer._rebuild_field_widgets()
-        row_id = self._card_table_widget.get_selected_row_id()
-        if row_id:
-            row = self._model.get_row(row_id)
-            self._card_designer.set_row(row)
+        self._model.notify_field_changed(field_id)
+        # Only the edited field's widget needs refreshing
+        self._card_designer.update_field(field_id)
         self._mark_unsaved()
     
     def _mark_unsaved(self) -> None:
         self._has_unsaved_changes = True
-        self._update_title()
+        if not self._title_timer.isActive():
+            self._title_timer.start()
     
     def _update_title(self) -> None:
         title = "Business Card Generator"
@@ -258,6 +309,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(title)
     
     def _on_new_project(self) -> None:
+        self._details_bar.flush_pending()
         if self._has_unsaved_changes:
             reply = QMessageBox.question(
                 self, "Unsaved Changes",
@@ -290,8 +342,9 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.StandardButton.Yes:
                 return
         
-        # Create new project
-        self._model = CardDataModel()
+        # Create new project, resetting the existing model in place so every
+        # view and signal connection stays valid
+        self._model.reset_with()
         self._current_project_name = name
         self._has_unsaved_changes = False
         
@@ -301,33 +354,16 @@ class MainWindow(QMainWindow):
         # Set project path on designer for image resolution
         self._card_designer.set_project_path(str(self.BASE_DIR / name))
         
-        # Update UI
-        self._card_designer.set_model(self._model)
-        self._card_table_widget._model = self._model
-        table_view = self._card_table_widget._table_view
-        table_view._model = self._model
-        table_view.setModel(self._model)
-        
-        # Reconnect selection model signals
-        sel_model = table_view.selectionModel()
-        if sel_model:
-            sel_model.selectionChanged.connect(table_view._on_selection_changed)
-        
-        # Reconnect template changed signal
-        self._model.template_changed.connect(table_view._configure_headers)
-        table_view._configure_headers()
-        
+        # Clear UI state
         self._details_bar.clear()
         self._card_designer.clear()
         self._card_table_widget._remove_row_btn.setEnabled(False)
         
-        self._model.dataChanged.connect(self._mark_unsaved)
-        self._model.template_changed.connect(self._mark_unsaved)
-        
         self._update_title()
         self.statusBar().showMessage(f"Project '{name}' created.", 3000)
     
     def _on_open_project(self) -> None:
+        self._details_bar.flush_pending()
         if self._has_unsaved_changes:
             reply = QMessageBox.question(
                 self, "Unsaved Changes",
@@ -368,8 +404,12 @@ class MainWindow(QMainWindow):
         if not self._current_project_name:
             return False
         
+        # Apply any held-back details bar edit before it's serialized
+        self._details_bar.flush_pending()
+        
         project_path = self.BASE_DIR / self._current_project_name
         project_path.mkdir(parents=True, exist_ok=True)
+        self._projects_cache = None
         
         data = {
             "version": "2.0",
@@ -378,8 +418,20 @@ class MainWindow(QMainWindow):
         }
         
         try:
-            with open(project_path / "project.json", 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Compact output: serialized in one C-accelerated call and
+            # written in a single write
+            payload = json.dumps(data, separators=(",", ":")).encode('utf-8')
+            project_file = project_path / "project.json"
+            
+            # Skip the write when this exact content was last saved here
+            saved = (project_file, hashlib.blake2b(payload, digest_size=16).digest())
+            if saved != self._last_saved or not project_file.exists():
+                # Write a temp file and rename it over the old one, so a
+                # crash mid-save never leaves a truncated project.json
+                tmp_file = project_path / "project.json.tmp"
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, project_file)
+                self._last_saved = saved
             
             self._has_unsaved_changes = False
             self._update_title()
@@ -390,6 +442,7 @@ class MainWindow(QMainWindow):
             return False
     
     def _load_from_disk(self, name: str) -> bool:
+        self._details_bar.flush_pending()
         project_path = self.BASE_DIR / name
         project_file = project_path / "project.json"
         
@@ -403,14 +456,11 @@ class MainWindow(QMainWindow):
             
             # Load template and rows
             template = CardTemplate.from_dict(data.get("template", {}))
-            rows_data = data.get("rows", [])
+            rows = [CardRow.from_dict(r) for r in data.get("rows", [])]
             
-            # Create new model with loaded data
-            self._model = CardDataModel()
-            self._model._template = template
-            for row_data in rows_data:
-                row = CardRow.from_dict(row_data)
-                self._model._rows.append(row)
+            # Load into the existing model, so every view and signal
+            # connection stays valid
+            self._model.reset_with(template, rows)
             
             self._current_project_name = name
             self._has_unsaved_changes = False
@@ -418,36 +468,11 @@ class MainWindow(QMainWindow):
             # Set project path on designer for image resolution
             self._card_designer.set_project_path(str(project_path))
             
-            # Update designer with new model
-            self._card_designer.set_model(self._model)
-            
-            # Explicitly rebuild field widgets to show the loaded template
-            self._card_designer._rebuild_field_widgets()
-            
-            # Update table widget - need to update both the widget and inner table view
-            self._card_table_widget._model = self._model
-            table_view = self._card_table_widget._table_view
-            table_view._model = self._model
-            table_view.setModel(self._model)
-            
-            # Reconnect selection model signals
-            sel_model = table_view.selectionModel()
-            if sel_model:
-                sel_model.selectionChanged.connect(table_view._on_selection_changed)
-            
-            # Reconnect template changed signal
-            self._model.template_changed.connect(table_view._configure_headers)
-            table_view._configure_headers()
-            
             # Clear UI state
             self._details_bar.clear()
             self._card_designer.clear()
             self._card_table_widget._remove_row_btn.setEnabled(False)
             
-            # Reconnect model signals for unsaved changes tracking
-            self._model.dataChanged.connect(self._mark_unsaved)
-            self._model.template_changed.connect(self._mark_unsaved)
-            
             self._update_title()
             self.statusBar().showMessage(f"Project '{name}' opened.", 3000)
             return True
@@ -456,16 +481,30 @@ class MainWindow(QMainWindow):
             return False
     
     def _list_projects(self) -> list[str]:
-        if not self.BASE_DIR.exists():
+        try:
+            mtime_ns = os.stat(self.BASE_DIR).st_mtime_ns
+        except FileNotFoundError:
             return []
         
-        projects = []
-        for item in self.BASE_DIR.iterdir():
-            if item.is_dir() and (item / "project.json").exists():
-                projects.append(item.name)
-        return sorted(projects)
+        # The folder's mtime changes whenever a project folder is added or
+        # removed; projects saved from here invalidate the cache directly
+        if self._projects_cache is not None and self._projects_cache[0] == mtime_ns:
+            return list(self._projects_cache[1])
+        
+        # DirEntry.is_dir() reuses the type from the directory listing, so
+        # only the project.json check needs a stat per entry
+        with os.scandir(self.BASE_DIR) as entries:
+            projects = sorted(
+                entry.name for entry in entries
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "project.json"))
+            )
+        self._projects_cache = (mtime_ns, projects)
+        return list(projects)
     
     def _on_export(self) -> None:
+        # Bump the template version for a held-back edit, so the export
+        # doesn't reuse renders from before it
+        self._details_bar.flush_pending()
         if self._model.rowCount() == 0:
             QMessageBox.information(self, "No Cards", "Add some cards before exporting.")
             return
@@ -495,31 +534,71 @@ class MainWindow(QMainWindow):
                 output_path = output_path.with_suffix(default_ext)
             
             try:
-                from src.business_card_generator.core.export_engine import ExportEngine
+                from src.business_card_generator.core.export_engine import (
+                    ExportEngine, ExportWorker
+                )
                 
                 project_path = None
                 if self._current_project_name:
                     project_path = str(self.BASE_DIR / self._current_project_name)
                 
                 engine = ExportEngine(self._model, project_path)
-                
-                if export_format == "PDF":
-                    success = engine.export_pdf(output_path, cards_per_page)
-                else:
-                    success = engine.export_docx(output_path, cards_per_page)
-                
-                if success:
-                    reply = QMessageBox.information(
-                        self, "Export Complete",
-                        f"Exported to:\n{output_path}\n\nOpen file location?",
-                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                    )
-                    if reply == QMessageBox.StandardButton.Yes:
-                        QDesktopServices.openUrl(QUrl.fromLocalFile(str(output_path.parent)))
-                else:
-                    QMessageBox.warning(self, "Export Failed", "No cards to export.")
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", f"Export failed: {e}")
+                return
+            
+            # Render on a worker thread; the modal progress dialog keeps the
+            # model from being edited until the export reports back
+            self._export_progress = QProgressDialog(
+                "Exporting cards...", "Cancel", 0, self._model.rowCount(), self
+            )
+            self._export_progress.setWindowTitle("Export")
+            self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._export_progress.setMinimumDuration(0)
+            self._export_progress.setAutoClose(False)
+            self._export_progress.setAutoReset(False)
+            
+            worker = ExportWorker(engine, export_format, output_path, cards_per_page)
+            # Kept past run() so cancel() is always safe to call
+            worker.setAutoDelete(False)
+            worker.signals.progress.connect(self._on_export_progress)
+            worker.signals.finished.connect(partial(self._on_export_finished, output_path))
+            worker.signals.cancelled.connect(self._finish_export)
+            worker.signals.error.connect(self._on_export_failed)
+            self._export_progress.canceled.connect(worker.cancel)
+            self._export_worker = worker
+            self._export_progress.show()
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_export_progress(self, done: int, total: int) -> None:
+        if self._export_progress is not None:
+            self._export_progress.setValue(done)
+    
+    def _finish_export(self) -> None:
+        """Close the export progress dialog and drop the worker."""
+        if self._export_progress is not None:
+            progress, self._export_progress = self._export_progress, None
+            # Closing emits canceled, which no longer matters
+            progress.canceled.disconnect()
+            progress.close()
+        self._export_worker = None
+    
+    def _on_export_finished(self, output_path: Path, success: bool) -> None:
+        self._finish_export()
+        if success:
+            reply = QMessageBox.information(
+                self, "Export Complete",
+                f"Exported to:\n{output_path}\n\nOpen file location?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(str(output_path.parent)))
+        else:
+            QMessageBox.warning(self, "Export Failed", "No cards to export.")
+    
+    def _on_export_failed(self, message: str) -> None:
+        self._finish_export()
+        QMessageBox.critical(self, "Export Error", f"Export failed: {message}")
     
     def _on_import_excel(self) -> None:
         """Import card data from an Excel file."""
@@ -531,96 +610,89 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
         
+        # Read the sheet on a worker thread; the model is only touched once
+        # the result is back on the GUI thread
+        self._import_progress = QProgressDialog("Reading Excel file...", None, 0, 0, self)
+        self._import_progress.setWindowTitle("Import from Excel")
+        self._import_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._import_progress.setMinimumDuration(0)
+        self._import_progress.show()
+        
+        worker = ExcelImportWorker(file_path)
+        worker.signals.finished.connect(self._apply_imported_excel)
+        worker.signals.error.connect(self._on_import_excel_failed)
+        # Keep the signals object alive until the worker reports back
+        self._import_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+    
+    def _finish_import_excel(self) -> None:
+        """Close the import progress dialog and drop the worker signals."""
+        if self._import_progress is not None:
+            self._import_progress.close()
+            self._import_progress = None
+        self._import_signals = None
+    
+    def _on_import_excel_failed(self, message: str) -> None:
+        self._finish_import_excel()
+        QMessageBox.critical(self, "Import Error", f"Failed to import: {message}")
+    
+    def _apply_imported_excel(self, sheet: ExcelSheet) -> None:
+        """Replace the template and rows with an imported sheet."""
+        self._finish_import_excel()
+        self._details_bar.flush_pending()
+        headers = sheet.headers
+        image_columns = sheet.image_columns
+        
+        if not headers:
+            QMessageBox.warning(self, "Import Error", "No columns found in Excel file.")
+            return
+        
         try:
-            from openpyxl import load_workbook
-            
-            wb = load_workbook(file_path, data_only=True)
-            ws = wb.active
-            
-            # Get headers from first row
-            headers = []
-            for col in range(1, ws.max_column + 1):
-                cell_value = ws.cell(row=1, column=col).value
-                if cell_value:
-                    headers.append(str(cell_value).strip())
-                else:
-                    headers.append(f"Column{col}")
-            
-            if not headers:
-                QMessageBox.warning(self, "Import Error", "No columns found in Excel file.")
-                return
-            
-            # Image file extensions for auto-detection
-            image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
-            
-            # Detect which columns are likely image columns based on content
-            image_columns = set()
-            for col_idx, header in enumerate(headers):
-                # Check first few data rows to detect image columns
-                for row in range(2, min(ws.max_row + 1, 10)):
-                    cell_value = ws.cell(row=row, column=col_idx + 1).value
-                    if cell_value:
-                        value_str = str(cell_value).lower()
-                        # Check if value looks like an image filename
-                        if any(value_str.endswith(ext) for ext in image_extensions):
-                            image_columns.add(col_idx)
-                            break
-                        # Also check if header suggests image
-                        header_lower = header.lower()
-                        if any(kw in header_lower for kw in ['photo', 'image', 'logo', 'picture', 'pic']):
-                            image_columns.add(col_idx)
-                            break
-            
-            # Clear existing template fields and create new ones from Excel columns
-            self._model.beginResetModel()
-            self._model._template.fields.clear()
-            self._model._rows.clear()
-            
-            from src.business_card_generator.models.card import FieldDefinition, FieldType, CardRow
+            from src.business_card_generator.models.card import FieldDefinition, FieldType
             
             # Create fields from headers
+            fields = []
             for col_idx, header in enumerate(headers):
                 field_type = FieldType.IMAGE if col_idx in image_columns else FieldType.TEXT
                 
                 # Calculate default position
                 y_offset = col_idx * 25
-                field_def = FieldDefinition(
+                fields.append(FieldDefinition(
                     name=header,
                     field_type=field_type,
                     x=10, y=10 + y_offset,
                     width=150 if field_type == FieldType.TEXT else 80,
                     height=25 if field_type == FieldType.TEXT else 80
-                )
-                self._model._template.fields.append(field_def)
-            
-            # Import data rows
-            for row_num in range(2, ws.max_row + 1):
-                row_data = CardRow()
-                has_data = False
-                
-                for col_idx, header in enumerate(headers):
-                    cell_value = ws.cell(row=row_num, column=col_idx + 1).value
-                    if cell_value is not None:
-                        has_data = True
-                        field_id = self._model._template.fields[col_idx].id
-                        row_data.set_value(field_id, str(cell_value))
-                
-                if has_data:
-                    self._model._rows.append(row_data)
-            
-            self._model.endResetModel()
-            self._model.template_changed.emit()
+                ))
+            
+            # Build all rows first, skipping ones without any data
+            field_ids = [f.id for f in fields]
+            new_rows = []
+            for values in sheet.rows:
+                data = {
+                    field_id: str(value)
+                    for field_id, value in zip(field_ids, values)
+                    if value is not None
+                }
+                if data:
+                    new_rows.append(CardRow(data=data))
+            
+            # Swap in the new fields and rows in one reset; the designer
+            # rebuilds and unsaved tracking fires from its template_changed
+            template = CardTemplate(
+                fields=fields,
+                background_color=self._model.get_template().background_color
+            )
+            self._model.reset_with(template, new_rows)
             
             # Update UI
-            self._card_designer._rebuild_field_widgets()
             self._card_designer.clear()
             self._details_bar.clear()
-            self._mark_unsaved()
             
             # Show summary
-            num_rows = len(self._model._rows)
+            num_rows = self._model.rowCount()
             num_cols = len(headers)
-            image_col_names = [headers[i] for i in image_columns]
+            image_col_names = [headers[i] for i in sorted(image_columns)]
             
             msg = f"Imported {num_rows} cards with {num_cols} fields."
             if image_col_names:
@@ -633,6 +705,7 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Import Error", f"Failed to import: {e}")
     
     def closeEvent(self, event: QCloseEvent) -> None:
+        self._details_bar.flush_pending()
         if self._has_unsaved_changes:
             reply = QMessageBox.question(
                 self, "Unsaved Changes",
@@ -697,7 +770,7 @@ class OpenProjectDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
-    def _on_double_click(self, item) -> None:
+    def _on_double_click(self, item: QListWidgetItem) -> None:
         self._selected = item.text()
         self.accept()
     
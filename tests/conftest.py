@@ -1,3 +1,26 @@
 """Shared fixtures and generators for tests."""
 
 import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_field_data():
+    """Serialized form of a fully specified text field.
+    
+    Shared across the session, so tests must copy it before changing it.
+    """
+    return {
+        "id": "test-id",
+        "name": "Phone",
+        "field_type": "text",
+        "x": 50,
+        "y": 100,
+        "width": 150,
+        "height": 25,
+        "font_size": 14,
+        "font_color": "#333333",
+        "font_family": "Helvetica",
+        "font_bold": True,
+        "font_italic": False,
+        "z_index": 5,
+    }
@@ -0,0 +1,234 @@
+"""Tests for the Qt card data model."""
+
+import pytest
+from PySide6.QtCore import Qt
+from src.business_card_generator.core.card_data_model import CardDataModel
+from src.business_card_generator.models.card import CardRow, CardTemplate, FieldDefinition
+
+
+@pytest.fixture
+def model(qapp):
+    """A data model with the default template fields."""
+    return CardDataModel()
+
+
+class TestUniqueFieldName:
+    """Tests for unique field name generation."""
+
+    def test_unused_name_is_returned_unchanged(self, model):
+        """Test a free name is used as-is."""
+        assert model.get_unique_field_name("Website") == "Website"
+
+    def test_suffix_added_for_taken_name(self, model):
+        """Test a taken name gets the first free suffix."""
+        assert model.get_unique_field_name("Name") == "Name_1"
+        model.add_field_definition(FieldDefinition(name="Name_1"))
+        assert model.get_unique_field_name("Name") == "Name_2"
+
+    def test_freed_suffix_is_reused(self, model):
+        """Test removing a suffixed field frees its name again."""
+        field_id = model.add_field_definition(FieldDefinition(name="Name_1"))
+        assert model.get_unique_field_name("Name") == "Name_2"
+        model.remove_field(field_id)
+        assert model.get_unique_field_name("Name") == "Name_1"
+
+    def test_rename_tracked(self, model):
+        """Test renamed fields are reflected in generated names."""
+        field_id = model.add_field_definition(FieldDefinition(name="Other"))
+        model.update_field_name(field_id, "Website")
+        assert model.get_unique_field_name("Website") == "Website_1"
+        assert model.get_unique_field_name("Other") == "Other"
+
+    def test_in_place_edit_after_notify(self, model):
+        """Test in-place renames are picked up after notify_field_changed."""
+        model.get_unique_field_name("Name")
+        field = model.get_all_fields()[0]
+        field.name = "Website"
+        model.notify_field_changed(field.id)
+        assert model.get_unique_field_name("Website") == "Website_1"
+
+
+class TestRowLookup:
+    """Tests for ID-based row lookup."""
+
+    def test_get_row_after_removal(self, model):
+        """Test rows after a removed one are still found by ID."""
+        ids = [model.add_row() for _ in range(4)]
+        assert model.remove_row(ids[1])
+        assert model.get_row(ids[1]) is None
+        for row_id in (ids[0], ids[2], ids[3]):
+            assert model.get_row(row_id).id == row_id
+        assert model.get_row_id_at_index(1) == ids[2]
+
+    def test_remove_missing_row(self, model):
+        """Test removing an unknown row ID returns False."""
+        model.add_row()
+        assert not model.remove_row("missing")
+        assert model.rowCount() == 1
+
+    def test_rows_from_reset_are_found(self, model):
+        """Test rows loaded with reset_with are found, as are rows added after."""
+        model.add_row()
+        rows = [CardRow(), CardRow()]
+        model.reset_with(rows=rows)
+        added = model.add_row()
+        assert model.get_row(rows[1].id) is rows[1]
+        assert model.index_of_row_id(rows[0].id) == 0
+        assert model.index_of_row_id(added) == 2
+
+    def test_index_of_row_id(self, model):
+        """Test index_of_row_id follows row removals."""
+        ids = [model.add_row() for _ in range(3)]
+        assert model.index_of_row_id(ids[2]) == 2
+        model.remove_row(ids[0])
+        assert model.index_of_row_id(ids[2]) == 1
+        assert model.index_of_row_id(ids[0]) is None
+
+    def test_remove_after_reset_and_add(self, model):
+        """Test removal keeps every lookup right after reset_with and add_row."""
+        loaded = [CardRow(), CardRow()]
+        model.reset_with(rows=loaded)
+        added = model.add_row()
+        assert model.remove_row(loaded[0].id)
+        expected = [loaded[1].id, added]
+        assert [model.index_of_row_id(row_id) for row_id in expected] == [0, 1]
+        assert [model.get_row(row_id).id for row_id in expected] == expected
+        assert model.get_row(loaded[0].id) is None
+        assert model.remove_row(added)
+        assert model.index_of_row_id(loaded[1].id) == 0
+        assert model.index_of_row_id(added) is None
+
+
+class TestZOrder:
+    """Tests for z-order caching."""
+
+    def test_sorted_order_follows_changes(self, model):
+        """Test the sorted field list is refreshed after z-order edits."""
+        first, second = model.get_fields_sorted_by_z_index()[:2]
+        model.bring_to_front(first.id)
+        assert model.get_fields_sorted_by_z_index()[-1] is first
+        assert model.get_max_z_index() == first.z_index
+        model.send_to_back(first.id)
+        assert model.get_fields_sorted_by_z_index()[0] is first
+        assert model.get_min_z_index() == first.z_index
+
+    def test_added_field_is_on_top(self, model):
+        """Test a new field is included in the cached order."""
+        model.get_fields_sorted_by_z_index()
+        field_id = model.add_field("Extra")
+        assert model.get_fields_sorted_by_z_index()[-1].id == field_id
+        model.remove_field(field_id)
+        assert all(f.id != field_id for f in model.get_fields_sorted_by_z_index())
+
+    def test_step_forward_and_backward(self, model):
+        """Test single-step moves swap with the neighbouring field."""
+        for field in model.get_all_fields():
+            model.bring_to_front(field.id)
+        first, second = model.get_fields_sorted_by_z_index()[:2]
+        model.bring_forward(first.id)
+        assert model.get_fields_sorted_by_z_index()[:2] == [second, first]
+        model.send_backward(first.id)
+        assert model.get_fields_sorted_by_z_index()[:2] == [first, second]
+
+    def test_moves_keep_cached_order(self, model):
+        """Test position and size updates don't drop the cached order."""
+        cached = model.get_fields_sorted_by_z_index()
+        field = cached[0]
+        model.update_field_position(field.id, 40, 50)
+        model.update_field_size(field.id, 60, 20)
+        assert model.get_fields_sorted_by_z_index() is cached
+
+    def test_set_fields_refreshes_order(self, model):
+        """Test fields replaced on the template directly are picked up."""
+        model.get_fields_sorted_by_z_index()
+        extra = FieldDefinition(name="Extra", z_index=100)
+        template = model.get_template()
+        template.set_fields([*template.fields, extra])
+        assert model.get_fields_sorted_by_z_index()[-1] is extra
+
+
+class TestBlockTemplateSignals:
+    """Tests for coalescing template_changed signals."""
+
+    def test_single_signal_for_batch(self, model):
+        """Test a batch of edits emits template_changed once."""
+        emitted = []
+        model.template_changed.connect(lambda: emitted.append(True))
+        fields = model.get_all_fields()
+        with model.block_template_signals():
+            for i, field in enumerate(fields):
+                model.update_field_position(field.id, i, i)
+            with model.block_template_signals():
+                model.bring_to_front(fields[0].id)
+            assert emitted == []
+        assert emitted == [True]
+
+    def test_no_signal_without_changes(self, model):
+        """Test an empty batch emits nothing."""
+        emitted = []
+        model.template_changed.connect(lambda: emitted.append(True))
+        with model.block_template_signals():
+            pass
+        assert emitted == []
+
+
+class TestDataRoles:
+    """Tests for role handling in data() and headerData()."""
+
+    def test_data_ignores_unused_roles(self, model):
+        """Test only display and edit roles return cell values."""
+        model.add_row()
+        index = model.index(0, 0)
+        model.setData(index, "Ada")
+        assert model.data(index, Qt.DisplayRole) == "Ada"
+        assert model.data(index, Qt.EditRole) == "Ada"
+        assert model.data(index, Qt.DecorationRole) is None
+        assert set(model.roleNames()) == {Qt.DisplayRole, Qt.EditRole}
+
+    def test_header_roles(self, model):
+        """Test header names and tooltips still come through."""
+        name = model.get_all_fields()[0].name
+        assert model.headerData(0, Qt.Horizontal, Qt.DisplayRole) == name
+        assert model.headerData(0, Qt.Horizontal, Qt.ToolTipRole).startswith(name)
+        assert model.headerData(0, Qt.Horizontal, Qt.FontRole) is None
+
+
+class TestResetWith:
+    """Tests for replacing the model contents in place."""
+
+    def test_reset_with_template_and_rows(self, model):
+        """Test the template and rows are replaced and lookups follow."""
+        model.add_row()
+        field = FieldDefinition(name="Only")
+        row = CardRow(data={field.id: "value"})
+        changes = []
+        model.template_changed.connect(lambda: changes.append(True))
+
+        model.reset_with(CardTemplate(fields=[field]), [row])
+        assert changes == [True]
+        assert model.columnCount() == 1
+        assert model.rowCount() == 1
+        assert model.get_row(row.id) is row
+        assert model.data(model.index(0, 0)) == "value"
+
+    def test_reset_with_defaults(self, model):
+        """Test no template restores the default fields with no rows."""
+        model.add_field("Extra")
+        model.add_row()
+        model.reset_with()
+        assert [f.name for f in model.get_all_fields()] == [
+            "Name", "Title", "Company", "Email", "Phone", "Photo"
+        ]
+        assert model.rowCount() == 0
+
+
+class TestTemplateVersion:
+    """Tests for the template version used to key render caches."""
+
+    def test_field_edit_bumps_version(self, model):
+        """Test an in-place style edit reported through notify_field_changed bumps it."""
+        field = model.get_all_fields()[0]
+        version = model.get_template_version()
+        field.font_color = "#FF0000"
+        model.notify_field_changed(field.id)
+        assert model.get_template_version() > version
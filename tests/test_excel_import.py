@@ -0,0 +1,50 @@
+"""Tests for reading Excel sheets."""
+
+import pytest
+from openpyxl import Workbook
+from src.business_card_generator.core.excel_import import DETECT_ROWS, read_excel
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """A workbook with a blank header, an image column and sparse cells."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", None, "Headshot", "Logo"])
+    ws.append(["Ada", "ada@example.com", "ada.PNG", None])
+    ws.append(["Bob", None, None, "acme"])
+    path = tmp_path / "cards.xlsx"
+    wb.save(path)
+    return str(path)
+
+
+class TestReadExcel:
+    """Tests for read_excel."""
+
+    def test_headers_and_rows(self, workbook_path):
+        """Test headers are read and blank ones get a placeholder name."""
+        sheet = read_excel(workbook_path)
+        assert sheet.headers == ["Name", "Column2", "Headshot", "Logo"]
+        assert sheet.rows == [
+            ["Ada", "ada@example.com", "ada.PNG", None],
+            ["Bob", None, None, "acme"],
+        ]
+
+    def test_image_columns_detected(self, workbook_path):
+        """Test image columns are found by extension or header keyword."""
+        sheet = read_excel(workbook_path)
+        assert sheet.image_columns == {2, 3}
+
+    def test_detection_limited_to_first_rows(self, tmp_path):
+        """Test values past the first DETECT_ROWS rows don't mark a column."""
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Name", "File"])
+        for i in range(DETECT_ROWS):
+            ws.append([f"name{i}.png" if i == DETECT_ROWS - 1 else f"n{i}", None])
+        ws.append(["n", "late.png"])
+        path = tmp_path / "late.xlsx"
+        wb.save(path)
+        sheet = read_excel(str(path))
+        assert sheet.image_columns == {0}
+        assert len(sheet.rows) == DETECT_ROWS + 1
@@ -0,0 +1,141 @@
+"""Tests for PDF and DOCX export."""
+
+import base64
+import os
+import re
+import zlib
+from io import BytesIO
+
+import pytest
+import reportlab
+from docx import Document
+from PIL import Image
+from src.business_card_generator.core import export_engine
+from src.business_card_generator.core.card_data_model import CardDataModel
+from src.business_card_generator.core.constants import CARD_HEIGHT, CARD_WIDTH
+from src.business_card_generator.core.export_engine import ExportEngine
+from src.business_card_generator.models.card import (
+    CardRow, CardTemplate, FieldDefinition, FieldType
+)
+
+
+@pytest.fixture
+def model(qapp, tmp_path):
+    """A model with a name and a logo, and five rows, two of them identical."""
+    logo_path = tmp_path / "logo.png"
+    Image.new("RGB", (40, 20), "#3366cc").save(logo_path)
+    name = FieldDefinition(name="Name", x=10, y=10, width=200, height=30)
+    logo = FieldDefinition(
+        name="Logo", field_type=FieldType.IMAGE, x=250, y=10, width=60, height=30
+    )
+    names = ["Ada", "Bob", "Cy", "Ada", "Dee"]
+    rows = [CardRow(data={name.id: value, logo.id: str(logo_path)}) for value in names]
+    model = CardDataModel()
+    model.reset_with(CardTemplate(fields=[name, logo]), rows)
+    return model
+
+
+def docx_card_images(path) -> list[bytes]:
+    """Return the bytes of every picture in a DOCX, in document order."""
+    doc = Document(str(path))
+    related = doc.part.related_parts
+    return [
+        related[shape._inline.graphic.graphicData.pic.blipFill.blip.embed].blob
+        for shape in doc.inline_shapes
+    ]
+
+
+def pdf_content(path) -> str:
+    """Return every stream of a reportlab PDF, decoded where needed, as text."""
+    streams = []
+    for data in re.findall(rb"stream\r?\n(.*?)endstream", path.read_bytes(), re.S):
+        data = data.strip()
+        if data.endswith(b"~>"):
+            data = zlib.decompress(base64.a85decode(data[:-2]))
+        streams.append(data.decode("latin-1"))
+    return "\n".join(streams)
+
+
+def text_model(text: str, **style) -> CardDataModel:
+    """A model with a single text field and one row showing the text."""
+    field = FieldDefinition(name="Name", x=10, y=10, width=300, height=30, **style)
+    model = CardDataModel()
+    model.reset_with(CardTemplate(fields=[field]), [CardRow(data={field.id: text})])
+    return model
+
+
+@pytest.fixture
+def font_files(monkeypatch):
+    """Replace the installed TrueType files with a dict the test fills in."""
+    files = {}
+    monkeypatch.setattr(export_engine, "_system_font_files", lambda: files)
+    export_engine._pdf_ttf_font.cache_clear()
+    yield files
+    export_engine._pdf_ttf_font.cache_clear()
+
+
+class TestExportPdf:
+    """Tests for export_pdf."""
+
+    def test_builtin_font_text_is_vector(self, qapp, tmp_path):
+        """Test text in a built-in PDF font is written as a text object."""
+        path = tmp_path / "cards.pdf"
+        assert ExportEngine(text_model("Ada Lovelace", font_family="Helvetica")).export_pdf(path, 1)
+        content = pdf_content(path)
+        assert "(Ada Lovelace) Tj" in content
+        assert "/Subtype /Image" not in path.read_text("latin-1")
+
+    def test_unencodable_text_is_rasterized(self, qapp, tmp_path):
+        """Test text outside cp1252 falls back to an image of the field."""
+        path = tmp_path / "cards.pdf"
+        assert ExportEngine(text_model("Ωmega", font_family="Helvetica")).export_pdf(path, 1)
+        assert "Tj" not in pdf_content(path)
+        assert "/Subtype /Image" in path.read_text("latin-1")
+
+    def test_missing_truetype_font_is_rasterized(self, qapp, tmp_path, font_files):
+        """Test a font with no built-in equivalent or installed file isn't swapped."""
+        path = tmp_path / "cards.pdf"
+        assert ExportEngine(text_model("Ada", font_family="Arial")).export_pdf(path, 1)
+        assert "Tj" not in pdf_content(path)
+        assert "/Subtype /Image" in path.read_text("latin-1")
+
+    def test_installed_truetype_font_is_embedded(self, qapp, tmp_path, font_files):
+        """Test an installed TrueType file is embedded for vector text."""
+        font_files["arialbd"] = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "VeraBd.ttf")
+        path = tmp_path / "cards.pdf"
+        model = text_model("Ada", font_family="Arial", font_bold=True)
+        assert ExportEngine(model).export_pdf(path, 1)
+        pdf = path.read_text("latin-1")
+        assert "BitstreamVeraSans-Bold" in pdf
+        assert "/FontFile2" in pdf
+        assert "/Subtype /Image" not in pdf
+
+    @pytest.mark.parametrize("color, fill", [
+        ("#abc", ".666667 .733333 .8 rg"),
+        ("red", "1 0 0 rg"),
+        ("#336699", ".2 .4 .6 rg"),
+    ])
+    def test_text_color(self, qapp, tmp_path, color, fill):
+        """Test text colors are read the way QColor reads them."""
+        path = tmp_path / "cards.pdf"
+        model = text_model("Ada", font_family="Helvetica", font_color=color)
+        assert ExportEngine(model).export_pdf(path, 1)
+        assert fill in pdf_content(path)
+
+
+class TestExportDocx:
+    """Tests for export_docx."""
+
+    def test_multi_page_export(self, model, tmp_path):
+        """Test every card is placed once, across pages, with its own render."""
+        path = tmp_path / "cards.docx"
+        assert ExportEngine(model).export_docx(path, 2, render_scale=1)
+        images = docx_card_images(path)
+        assert len(images) == 5
+        for image_bytes in images:
+            with Image.open(BytesIO(image_bytes)) as image:
+                assert image.format == "JPEG"
+                assert image.size == (CARD_WIDTH, CARD_HEIGHT)
+        # Identical rows share a render, different rows don't
+        assert images[0] == images[3]
+        assert len(set(images)) == 4
@@ -1,5 +1,10 @@
 """Tests for data models."""
 
+import copy
+import pickle
+import subprocess
+import sys
+
 import pytest
 from src.business_card_generator.models.card import (
     FieldDefinition,
@@ -41,29 +46,60 @@ class TestFieldDefinition:
         assert data["x"] == 10
         assert data["y"] == 20
 
-    def test_field_from_dict(self):
+    @pytest.mark.parametrize(
+        "type_value,field_type",
+        [("text", FieldType.TEXT), ("image", FieldType.IMAGE)],
+    )
+    def test_field_from_dict(self, sample_field_data, type_value, field_type):
         """Test deserialization from dictionary."""
-        data = {
-            "id": "test-id",
-            "name": "Phone",
-            "field_type": "text",
-            "x": 50,
-            "y": 100,
-            "width": 150,
-            "height": 25,
-            "font_size": 14,
-            "font_color": "#333333",
-            "font_family": "Helvetica",
-            "font_bold": True,
-            "font_italic": False,
-            "z_index": 5,
-        }
+        data = {**sample_field_data, "field_type": type_value}
         field = FieldDefinition.from_dict(data)
         assert field.id == "test-id"
         assert field.name == "Phone"
+        assert field.field_type is field_type
         assert field.font_bold is True
         assert field.z_index == 5
 
+    def test_field_from_dict_invalid_color(self, sample_field_data):
+        """Test malformed colors fall back to the default on load."""
+        base = sample_field_data
+        for color in ("notacolor", "#12345", "#1234567", "#GGGGGG", "", None, 123):
+            field = FieldDefinition.from_dict({**base, "font_color": color})
+            assert field.font_color == "#000000"
+        field = FieldDefinition.from_dict({**base, "font_color": "#a1B2c3"})
+        assert field.font_color == "#a1B2c3"
+
+    @pytest.mark.parametrize("color", ["#abc", "#80FF0000", "red", "DarkSlateGray"])
+    def test_field_from_dict_keeps_other_qt_colors(self, sample_field_data, color):
+        """Test short hex, ARGB hex and named colors survive loading."""
+        field = FieldDefinition.from_dict({**sample_field_data, "font_color": color})
+        assert field.font_color == color
+        template = CardTemplate.from_dict({"background_color": color})
+        assert template.background_color == color
+
+    def test_field_from_dict_matches_qt_color_names(self, sample_field_data):
+        """Test exactly the names QColor parses survive loading."""
+        from PySide6.QtGui import QColor
+        for color in [*QColor.colorNames(), "Dark Slate Gray", "DARKRED"]:
+            assert QColor.isValidColorName(color)
+            field = FieldDefinition.from_dict({**sample_field_data, "font_color": color})
+            assert field.font_color == color
+        for color in ("darkredd", "#abcd", "#1234567890"):
+            assert not QColor.isValidColorName(color)
+            field = FieldDefinition.from_dict({**sample_field_data, "font_color": color})
+            assert field.font_color == "#000000"
+
+    def test_loading_does_not_import_qt(self):
+        """Test the models load any color without pulling in Qt."""
+        code = (
+            "import sys\n"
+            "from src.business_card_generator.models.card import CardTemplate\n"
+            "CardTemplate.from_dict({'background_color': 'red'})\n"
+            "CardTemplate.from_dict({'background_color': 'notacolor'})\n"
+            "assert not any(name.startswith('PySide6') for name in sys.modules)\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_field_copy(self):
         """Test copying a field creates new ID."""
         original = FieldDefinition(name="Title", x=10, y=20)
@@ -105,17 +141,6 @@ class TestCardTemplate:
         assert found is not None
         assert found.id == field.id
 
-    def test_template_serialization(self):
-        """Test template to/from dict."""
-        field = FieldDefinition(name="Name", x=10, y=20)
-        template = CardTemplate(fields=[field], background_color="#EEEEEE")
-        
-        data = template.to_dict()
-        restored = CardTemplate.from_dict(data)
-        
-        assert restored.background_color == "#EEEEEE"
-        assert len(restored.fields) == 1
-        assert restored.fields[0].name == "Name"
 
 
 class TestCardRow:
@@ -138,15 +163,112 @@ class TestCardRow:
         row = CardRow()
         assert row.get_value("nonexistent") == ""
 
-    def test_row_serialization(self):
-        """Test row to/from dict."""
-        row = CardRow()
-        row.set_value("name", "Jane")
-        row.set_value("email", "jane@example.com")
-        
-        data = row.to_dict()
-        restored = CardRow.from_dict(data)
-        
-        assert restored.id == row.id
-        assert restored.get_value("name") == "Jane"
-        assert restored.get_value("email") == "jane@example.com"
+
+def _sample_field() -> FieldDefinition:
+    return FieldDefinition(
+        name="Phone", field_type=FieldType.IMAGE, x=50, y=100, width=150,
+        height=25, font_size=14, font_color="#333333", font_family="Helvetica",
+        font_bold=True, font_italic=True, z_index=5,
+    )
+
+
+def _sample_template() -> CardTemplate:
+    return CardTemplate(
+        fields=[FieldDefinition(name="Name", x=10, y=20), _sample_field()],
+        background_color="#EEEEEE",
+    )
+
+
+def _sample_row() -> CardRow:
+    row = CardRow()
+    row.set_value("name", "Jane")
+    row.set_value("email", "jane@example.com")
+    return row
+
+
+class TestSerializationRoundTrip:
+    """Round-trip tests shared by the serializable models."""
+
+    @pytest.mark.parametrize(
+        "factory",
+        [_sample_field, _sample_template, _sample_row],
+        ids=["field", "template", "row"],
+    )
+    def test_roundtrip(self, factory):
+        """Test from_dict(to_dict()) restores every serialized value."""
+        original = factory()
+        data = original.to_dict()
+        restored = type(original).from_dict(data)
+        assert restored == original
+        assert restored.to_dict() == data
+
+
+class TestCardTemplateLookup:
+    """Tests for CardTemplate ID and name lookups."""
+
+    def test_lookup_after_add_and_remove(self):
+        """Test lookups follow add_field and remove_field."""
+        template = CardTemplate()
+        name_field = FieldDefinition(name="Name")
+        email_field = FieldDefinition(name="Email")
+        template.add_field(name_field)
+        template.add_field(email_field)
+        assert template.get_field_by_id(email_field.id) is email_field
+        assert template.get_field_by_name("Name") is name_field
+
+        assert template.remove_field(name_field.id) == 0
+        assert template.get_field_by_id(name_field.id) is None
+        assert template.get_field_by_name("Name") is None
+        assert template.remove_field(name_field.id) is None
+
+    def test_lookup_after_rename_and_set_fields(self):
+        """Test lookups follow reindex() and set_fields()."""
+        field = FieldDefinition(name="Name")
+        template = CardTemplate(fields=[field])
+        assert template.get_field_by_name("Name") is field
+
+        field.name = "Full Name"
+        template.reindex()
+        assert template.get_field_by_name("Name") is None
+        assert template.get_field_by_name("Full Name") is field
+
+        other = FieldDefinition(name="Other")
+        template.set_fields([other])
+        assert template.get_field_by_id(field.id) is None
+        assert template.get_field_by_name("Full Name") is None
+        assert template.get_field_by_id(other.id) is other
+
+    def test_duplicate_name_after_removal(self):
+        """Test the next field with a removed field's name takes over its lookup."""
+        first = FieldDefinition(name="Name")
+        second = FieldDefinition(name="Name")
+        template = CardTemplate(fields=[first, second])
+        assert template.get_field_by_name("Name") is first
+        assert template.remove_field(first.id) == 0
+        assert template.get_field_by_name("Name") is second
+
+    @pytest.mark.parametrize("clone", [
+        copy.deepcopy,
+        lambda template: pickle.loads(pickle.dumps(template)),
+    ], ids=["deepcopy", "pickle"])
+    def test_lookup_on_copies(self, clone):
+        """Test a copied template looks up its own fields."""
+        field = FieldDefinition(name="Name")
+        template = clone(CardTemplate(fields=[field]))
+        copied = template.fields[0]
+        assert copied is not field
+        assert template.get_field_by_id(field.id) is copied
+        assert template.get_field_by_name("Name") is copied
+
+
+class TestFieldCopy:
+    """Tests for FieldDefinition.copy overrides."""
+
+    def test_copy_with_changes(self):
+        """Test copy applies overrides and keeps other values."""
+        original = FieldDefinition(name="Name", x=10, font_bold=True)
+        copied = original.copy(name="Name_1", x=50)
+        assert copied.id != original.id
+        assert (copied.name, copied.x) == ("Name_1", 50)
+        assert copied.font_bold is True
+        assert (original.name, original.x) == ("Name", 10)